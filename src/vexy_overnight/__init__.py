@@ -9,32 +9,58 @@ into two families:
 * Modern management components (``ConfigManager`` and friends) that power the
   consolidated CLI experience.
 
-The lazy import/``try`` block ensures older environments without the newer
-modules remain functional while we migrate all consumers to the streamlined
-tooling.
+The management components are resolved lazily through a module-level
+``__getattr__`` (PEP 562) so ``import vexy_overnight`` does not pay for loading
+every manager module and its dependencies up front.
 """
 # this_file: src/vexy_overnight/__init__.py
 
+from __future__ import annotations
+
+from typing import Any
+
 from .__version__ import __version__
 from .vexy_overnight import Config, Summary, process_data
 
-# Import new vomgr components
-try:
-    from .config import ConfigManager
-    from .hooks import HookManager
-    from .launchers import LauncherManager, vocl, voco, voge
-    from .rules import RulesManager
-    from .updater import UpdateManager
-except ImportError:
-    # Allow graceful degradation if new modules not available yet
-    ConfigManager = None
-    HookManager = None
-    LauncherManager = None
-    RulesManager = None
-    UpdateManager = None
-    vocl = None
-    voco = None
-    voge = None
+# Public name -> submodule that defines it, imported on first attribute access
+_LAZY = {
+    "ConfigManager": ".config",
+    "HookManager": ".hooks",
+    "LauncherManager": ".launchers",
+    "vocl": ".launchers",
+    "voco": ".launchers",
+    "voge": ".launchers",
+    "RulesManager": ".rules",
+    "UpdateManager": ".updater",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import and cache lazily exported names on first access.
+
+    Args:
+        name: Attribute requested from the package.
+
+    Returns:
+        Any: Object exported by the owning submodule.
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily exported symbol.
+    """
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return module attributes including lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "__version__",
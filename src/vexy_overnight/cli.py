@@ -17,55 +17,153 @@ validated method invocations.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from pathlib import Path
-
-import fire
-from fire.core import FireError
+import functools
+import sys
+from typing import TYPE_CHECKING, NoReturn
 
 from . import __version__
-from .config import ConfigManager
-from .hooks import HookManager
-from .launchers import LauncherManager
-from .rules import RulesManager
-from .updater import UpdateManager
 from .user_settings import (
-    CONTINUATION_TOOLS,
+    _CONTINUATION_TOOL_SET,
     UserSettings,
     load_user_settings,
     save_user_settings,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from .config import ConfigManager
+    from .hooks import HookManager
+    from .launchers import LauncherManager
+    from .rules import RulesManager
+    from .updater import UpdateManager
+
+
+# Argument vectors answered directly by main() without building the Fire tree
+_VERSION_ARGV = (["version"], ["--version"], ["-V"])
+
+# ConfigManager method names per tool; tools without an entry are unsupported
+_ENABLE_METHODS = {"claude": "enable_claude_hook", "codex": "enable_codex_hook"}
+_DISABLE_METHODS = {"claude": "disable_claude_hook", "codex": "disable_codex_hook"}
+
+
+def _fire_error(message: str) -> NoReturn:
+    """Raise :class:`fire.core.FireError` without importing Fire at module load.
+
+    Args:
+        message: Error message surfaced to the CLI caller.
+
+    Raises:
+        FireError: Always.
+    """
+    from fire.core import FireError
+
+    raise FireError(message)
+
+
+def _default_config_manager() -> ConfigManager:
+    """Import and construct :class:`ConfigManager` on first use."""
+    from .config import ConfigManager
+
+    return ConfigManager()
+
 
+def _default_hook_manager() -> HookManager:
+    """Import and construct :class:`HookManager` on first use."""
+    from .hooks import HookManager
+
+    return HookManager()
+
+
+def _default_launcher_manager() -> LauncherManager:
+    """Import and construct :class:`LauncherManager` on first use."""
+    from .launchers import LauncherManager
+
+    return LauncherManager()
+
+
+def _default_rules_manager(global_mode: bool = False) -> RulesManager:
+    """Import and construct :class:`RulesManager` on first use.
+
+    Args:
+        global_mode: When ``True`` operate on global instruction files.
+    """
+    from .rules import RulesManager
+
+    return RulesManager(global_mode=global_mode)
+
+
+def _default_update_manager() -> UpdateManager:
+    """Import and construct :class:`UpdateManager` on first use."""
+    from .updater import UpdateManager
+
+    return UpdateManager()
+
+
+@functools.lru_cache(maxsize=16)
 def _validate_tool(tool: str) -> str:
     """Normalise and validate a continuation tool identifier.
 
+    Successful validations are memoised; rejected names raise and are
+    therefore never cached.  Already-canonical names skip ``str.lower``.
+
     Args:
         tool: Raw tool name provided by the CLI caller.
 
     Returns:
-        str: The lower-case tool name after validation.
+        str: The interned lower-case tool name after validation.
 
     Raises:
         FireError: If ``tool`` is not a supported continuation target.
     """
-    normalized = tool.lower()
-    if normalized not in CONTINUATION_TOOLS:
-        raise FireError("tool must be one of claude, codex, gemini")
-    return normalized
+    normalized = tool if tool in _CONTINUATION_TOOL_SET else tool.lower()
+    if normalized not in _CONTINUATION_TOOL_SET:
+        _fire_error("tool must be one of claude, codex, gemini")
+    return sys.intern(normalized)
 
 
-class ContinuationCLI:
-    """Fire namespace for managing continuation routing.
+@functools.lru_cache(maxsize=8)
+def _to_path(value: str | None) -> Path | None:
+    """Convert an optional CLI path argument into a :class:`Path`.
 
-    The continuation settings determine which downstream tool should pick up
-    the work once a session finishes.  This helper exposes the relevant
-    ``vomgr continuation`` commands and keeps persistence concerns isolated in
-    :class:`vexy_overnight.user_settings.UserSettings`.
+    Args:
+        value: Raw directory string, or ``None``/empty when not supplied.
+
+    Returns:
+        Path | None: Parsed path, or ``None`` when no value was given.
+    """
+    if not value:
+        return None
+    from pathlib import Path
+
+    return Path(value)
+
+
+def _normalize_key(key: str) -> str:
+    """Lower-case ``key`` without allocating when it is already lower-case.
+
+    Args:
+        key: Identifier supplied on the command line.
+
+    Returns:
+        str: ``key`` itself when already lower-case, otherwise a lowered copy.
+    """
+    return key if key.islower() else key.lower()
+
+
+class _SettingsStore:
+    """Memoised :class:`UserSettings` snapshot shared by the settings namespaces.
+
+    The snapshot is loaded on first use and reused by every namespace, so
+    chained calls such as ``continuation set`` followed by ``prompt set`` do
+    not re-read the settings file and never overwrite each other's changes
+    with a stale copy.  Saving refreshes the snapshot; a failed save discards
+    it so the next read starts from disk again.
 
     Attributes:
-        _load: Loader that returns the latest persisted user settings.
-        _save: Saver that persists mutated settings to disk.
+        _loader: Loader that returns the latest persisted user settings.
+        _saver: Saver that persists mutated settings to disk.
     """
 
     def __init__(
@@ -73,14 +171,87 @@ class ContinuationCLI:
         loader: Callable[[], UserSettings],
         saver: Callable[[UserSettings], Path],
     ) -> None:
-        """Create a continuation namespace with injected persistence helpers.
+        """Create a store around injected persistence helpers.
 
         Args:
             loader: Callable used to fetch the current settings snapshot.
             saver: Callable used to persist any changes back to storage.
         """
-        self._load = loader
-        self._save = saver
+        self._loader = loader
+        self._saver = saver
+        self._cached: UserSettings | None = None
+
+    def load(self) -> UserSettings:
+        """Return the cached settings snapshot, loading it on first use.
+
+        Returns:
+            UserSettings: Settings shared by all settings namespaces.
+        """
+        if self._cached is None:
+            self._cached = self._loader()
+        return self._cached
+
+    def save(self, settings: UserSettings) -> Path:
+        """Persist ``settings`` and keep them as the cached snapshot.
+
+        Args:
+            settings: Settings object to write.
+
+        Returns:
+            Path: Location reported by the injected saver.
+        """
+        try:
+            path = self._saver(settings)
+        except Exception:
+            self._cached = None
+            raise
+        self._cached = settings
+        return path
+
+
+class _SettingsNamespace:
+    """Base for Fire namespaces that read and persist :class:`UserSettings`.
+
+    Attributes:
+        _store: Settings store shared with the sibling namespaces.
+    """
+
+    def __init__(self, store: _SettingsStore) -> None:
+        """Create a namespace backed by the shared settings ``store``.
+
+        Args:
+            store: Memoised settings store owned by :class:`VomgrCLI`.
+        """
+        self._store = store
+
+    def _load(self) -> UserSettings:
+        """Return the shared settings snapshot.
+
+        Returns:
+            UserSettings: Current user settings.
+        """
+        return self._store.load()
+
+    def _save(self, settings: UserSettings) -> Path:
+        """Persist ``settings`` through the shared store.
+
+        Args:
+            settings: Settings object to write.
+
+        Returns:
+            Path: Location reported by the store's saver.
+        """
+        return self._store.save(settings)
+
+
+class ContinuationCLI(_SettingsNamespace):
+    """Fire namespace for managing continuation routing.
+
+    The continuation settings determine which downstream tool should pick up
+    the work once a session finishes.  This helper exposes the relevant
+    ``vomgr continuation`` commands and keeps persistence concerns isolated in
+    :class:`vexy_overnight.user_settings.UserSettings`.
+    """
 
     def set(self, source: str, target: str) -> str:
         """Enable continuation for ``source`` and point it at ``target``.
@@ -135,27 +306,8 @@ class ContinuationCLI:
         }
 
 
-class PromptCLI:
-    """Expose commands for editing continuation prompt templates.
-
-    Attributes:
-        _load: Callable returning the persisted :class:`UserSettings` object.
-        _save: Callable that persists updates back to storage.
-    """
-
-    def __init__(
-        self,
-        loader: Callable[[], UserSettings],
-        saver: Callable[[UserSettings], Path],
-    ) -> None:
-        """Initialise the CLI namespace with storage helpers.
-
-        Args:
-            loader: Fetches the latest settings prior to mutation.
-            saver: Persists updated settings once modifications are applied.
-        """
-        self._load = loader
-        self._save = saver
+class PromptCLI(_SettingsNamespace):
+    """Expose commands for editing continuation prompt templates."""
 
     def set(self, tool: str, template: str) -> str:
         """Persist a continuation prompt template for ``tool``.
@@ -187,7 +339,7 @@ class PromptCLI:
         return settings.prompts.get(tool_key, "Continue")
 
 
-class NotifyCLI:
+class NotifyCLI(_SettingsNamespace):
     """Manage notification preferences exposed via the CLI.
 
     Notifications are delivered by the continuation helpers to let the user
@@ -195,20 +347,6 @@ class NotifyCLI:
     tune the message, toggle the feature, or switch the alert sound.
     """
 
-    def __init__(
-        self,
-        loader: Callable[[], UserSettings],
-        saver: Callable[[UserSettings], Path],
-    ) -> None:
-        """Initialise the CLI sub-component with persistence helpers.
-
-        Args:
-            loader: Callable retrieving the latest settings snapshot.
-            saver: Callable persisting modified settings back to disk.
-        """
-        self._load = loader
-        self._save = saver
-
     def set(self, message: str | None = None, enabled: bool | None = None) -> str:
         """Override notification content and activation state.
 
@@ -241,7 +379,7 @@ class NotifyCLI:
             FireError: If ``name`` is empty.
         """
         if not name:
-            raise FireError("sound name must be non-empty")
+            _fire_error("sound name must be non-empty")
         settings = self._load()
         settings.notifications.sound = name
         self._save(settings)
@@ -259,7 +397,7 @@ class NotifyCLI:
         return {"enabled": prefs.enabled, "message": prefs.message, "sound": prefs.sound}
 
 
-class TerminalCLI:
+class TerminalCLI(_SettingsNamespace):
     """Manage how continuation helpers spawn terminal windows.
 
     Each platform can have a different command template.  This namespace maps
@@ -267,20 +405,6 @@ class TerminalCLI:
     the stored command sequences.
     """
 
-    def __init__(
-        self,
-        loader: Callable[[], UserSettings],
-        saver: Callable[[UserSettings], Path],
-    ) -> None:
-        """Store helpers used to read and persist user settings.
-
-        Args:
-            loader: Callable returning the latest :class:`UserSettings`.
-            saver: Callable persisting updated settings objects.
-        """
-        self._load = loader
-        self._save = saver
-
     def set(self, platform_key: str, *command: str) -> str:
         """Persist a terminal launch command for ``platform_key``.
 
@@ -296,11 +420,11 @@ class TerminalCLI:
             FireError: If no command arguments are supplied or the placeholder
                 is missing from the final element.
         """
-        key = platform_key.lower()
+        key = _normalize_key(platform_key)
         if not command:
-            raise FireError("provide a terminal command containing {command} placeholder")
+            _fire_error("provide a terminal command containing {command} placeholder")
         if "{command}" not in command[-1]:
-            raise FireError("last argument must include {command} placeholder")
+            _fire_error("last argument must include {command} placeholder")
         settings = self._load()
         settings.terminals.defaults[key] = list(command)
         self._save(settings)
@@ -318,11 +442,11 @@ class TerminalCLI:
         Raises:
             FireError: If the command has not been configured yet.
         """
-        key = platform_key.lower()
+        key = _normalize_key(platform_key)
         settings = self._load()
         command = settings.terminals.defaults.get(key)
         if command is None:
-            raise FireError(f"no terminal command configured for {key}")
+            _fire_error(f"no terminal command configured for {key}")
         return command
 
 
@@ -336,13 +460,11 @@ class VomgrCLI:
 
     def __init__(
         self,
-        config_factory: Callable[[], ConfigManager] = ConfigManager,
-        hook_factory: Callable[[], HookManager] = HookManager,
-        launcher_factory: Callable[[], LauncherManager] = LauncherManager,
-        rules_factory: Callable[[bool], RulesManager] = lambda global_mode=False: RulesManager(
-            global_mode=global_mode
-        ),
-        update_factory: Callable[[], UpdateManager] = UpdateManager,
+        config_factory: Callable[[], ConfigManager] = _default_config_manager,
+        hook_factory: Callable[[], HookManager] = _default_hook_manager,
+        launcher_factory: Callable[[], LauncherManager] = _default_launcher_manager,
+        rules_factory: Callable[[bool], RulesManager] = _default_rules_manager,
+        update_factory: Callable[[], UpdateManager] = _default_update_manager,
         settings_loader: Callable[[], UserSettings] = load_user_settings,
         settings_saver: Callable[[UserSettings], Path] = save_user_settings,
     ) -> None:
@@ -350,6 +472,8 @@ class VomgrCLI:
 
         Args:
             config_factory: Produces :class:`ConfigManager` instances on demand.
+                Every factory is memoised, so repeated commands on one CLI
+                instance share the same collaborator.
             hook_factory: Produces :class:`HookManager` objects.
             launcher_factory: Produces :class:`LauncherManager` objects.
             rules_factory: Produces :class:`RulesManager` instances; accepts a
@@ -358,18 +482,20 @@ class VomgrCLI:
             settings_loader: Loads persisted user settings for subcommands.
             settings_saver: Persists updated settings back to disk.
         """
-        self._config_factory = config_factory
-        self._hook_factory = hook_factory
-        self._launcher_factory = launcher_factory
-        self._rules_factory = rules_factory
-        self._update_factory = update_factory
+        # Each collaborator is built at most once per CLI instance (per mode for rules)
+        self._config_factory = functools.lru_cache(maxsize=1)(config_factory)
+        self._hook_factory = functools.lru_cache(maxsize=1)(hook_factory)
+        self._launcher_factory = functools.lru_cache(maxsize=1)(launcher_factory)
+        self._rules_factory = functools.lru_cache(maxsize=2)(rules_factory)
+        self._update_factory = functools.lru_cache(maxsize=1)(update_factory)
         self._settings_loader = settings_loader
         self._settings_saver = settings_saver
 
-        self.continuation = ContinuationCLI(settings_loader, settings_saver)
-        self.prompt = PromptCLI(settings_loader, settings_saver)
-        self.notify = NotifyCLI(settings_loader, settings_saver)
-        self.terminal = TerminalCLI(settings_loader, settings_saver)
+        store = _SettingsStore(settings_loader, settings_saver)
+        self.continuation = ContinuationCLI(store)
+        self.prompt = PromptCLI(store)
+        self.notify = NotifyCLI(store)
+        self.terminal = TerminalCLI(store)
 
     def version(self) -> str:
         """Return the installed vomgr package version string.
@@ -438,13 +564,10 @@ class VomgrCLI:
             FireError: If ``tool`` is not recognised by the CLI.
         """
         tool_key = _validate_tool(tool)
-        config_mgr = self._config_factory()
-        if tool_key == "claude":
-            config_mgr.enable_claude_hook()
-        elif tool_key == "codex":
-            config_mgr.enable_codex_hook()
-        else:
+        method = _ENABLE_METHODS.get(tool_key)
+        if method is None:
             return "Gemini continuation not yet implemented"
+        getattr(self._config_factory(), method)()
         return f"{tool_key} continuation enabled"
 
     def disable(self, tool: str) -> str:
@@ -460,13 +583,10 @@ class VomgrCLI:
             FireError: If ``tool`` is not recognised.
         """
         tool_key = _validate_tool(tool)
-        config_mgr = self._config_factory()
-        if tool_key == "claude":
-            config_mgr.disable_claude_hook()
-        elif tool_key == "codex":
-            config_mgr.disable_codex_hook()
-        else:
+        method = _DISABLE_METHODS.get(tool_key)
+        if method is None:
             return "Gemini continuation not yet implemented"
+        getattr(self._config_factory(), method)()
         return f"{tool_key} continuation disabled"
 
     def run(
@@ -494,7 +614,7 @@ class VomgrCLI:
         """
         tool_key = _validate_tool(tool)
         launcher = self._launcher_factory()
-        path = Path(cwd) if cwd else None
+        path = _to_path(cwd)
         if tool_key == "claude":
             launcher.launch_claude(cwd=path, model=model, prompt=prompt)
         elif tool_key == "codex":
@@ -540,13 +660,17 @@ class VomgrCLI:
 
         if search is not None:
             results = rules_mgr.search_files(search)
-            formatted = [f"{path}: {len(matches)} match(es)" for path, matches in results.items()]
-            messages.extend(formatted if formatted else ["No matches found"])
+            if results:
+                messages.extend(
+                    f"{path}: {len(matches)} match(es)" for path, matches in results.items()
+                )
+            else:
+                messages.append("No matches found")
 
         if replace is not None:
             pair = list(replace)
             if len(pair) != 2:
-                raise FireError("replace expects two values: search and replace")
+                _fire_error("replace expects two values: search and replace")
             rules_mgr.replace_in_files(pair[0], pair[1])
             messages.append("Text replaced in instruction files")
 
@@ -581,11 +705,13 @@ class VomgrCLI:
 
         if check:
             versions = updater.check_versions()
-            lines = [
-                f"{tool}: {info['current']} -> {info['available']}"
-                for tool, info in versions.items()
-            ]
-            messages.extend(lines if lines else ["No version information available"])
+            if versions:
+                messages.extend(
+                    f"{tool}: {info['current']} -> {info['available']}"
+                    for tool, info in versions.items()
+                )
+            else:
+                messages.append("No version information available")
 
         if all or cli:
             updater.update_cli_tools(dry_run=dry_run, skip=skip)
@@ -604,17 +730,15 @@ class VomgrCLI:
             str: Multi-line string describing which tools are enabled and
             whether their binaries are discoverable.
         """
-        config_mgr = self._config_factory()
-        claude_enabled = config_mgr.is_claude_hook_enabled()
-        codex_enabled = config_mgr.is_codex_hook_enabled()
-        claude_installed = config_mgr.is_tool_installed("claude")
-        codex_installed = config_mgr.is_tool_installed("codex")
-        gemini_installed = config_mgr.is_tool_installed("gemini")
+        snapshot = self._config_factory().status_snapshot()
+        claude, codex, gemini = snapshot["claude"], snapshot["codex"], snapshot["gemini"]
         lines = [
             "vomgr status",
-            f"Claude: {'enabled' if claude_enabled else 'disabled'} (installed={claude_installed})",
-            f"Codex: {'enabled' if codex_enabled else 'disabled'} (installed={codex_installed})",
-            f"Gemini installed={gemini_installed}",
+            f"Claude: {'enabled' if claude['hook_enabled'] else 'disabled'} "
+            f"(installed={claude['installed']})",
+            f"Codex: {'enabled' if codex['hook_enabled'] else 'disabled'} "
+            f"(installed={codex['installed']})",
+            f"Gemini installed={gemini['installed']}",
         ]
         return "\n".join(lines)
 
@@ -623,8 +747,14 @@ def main() -> None:
     """Invoke Fire with :class:`VomgrCLI` as the root component.
 
     The function exists so console entry points created by packaging tools can
-    import and execute it directly.
+    import and execute it directly.  Bare version requests are answered
+    without importing Fire.
     """
+    if sys.argv[1:] in _VERSION_ARGV:
+        print(__version__)
+        return
+    import fire
+
     fire.Fire(VomgrCLI)
 
 
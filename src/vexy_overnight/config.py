@@ -3,24 +3,236 @@
 """Helpers for managing Claude and Codex configuration files.
 
 The :class:`ConfigManager` centralises filesystem operations required for
-installing or removing continuation hooks.  All write operations are performed
-via a defensive write-and-validate workflow that creates a backup before
-touching the original files, guaranteeing users can roll back on failure.
+installing or removing continuation hooks.  All write operations validate the
+serialised document first and then swap it in atomically, so a failure never
+leaves a half-written config behind; a timestamped backup of the previous file
+is kept so users can roll back a change by hand.
 """
 
 from __future__ import annotations
 
+import copy
+import errno
 import json
+import os
 import shutil
+import sys
+import time
 from collections.abc import Callable
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import tomli
 import tomli_w
 from loguru import logger
 
+from .file_signature import FileSignature, stat_signature
+from .path_lookup import which
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover - exercised on Python 3.10 only
+    import tomli as tomllib
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None
+
+# Parsed config documents keyed by path, tagged with their file signature
+_CONFIG_CACHE: dict[Path, tuple[FileSignature, dict[str, Any]]] = {}
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON document, preferring ``orjson`` when it is installed.
+
+    Args:
+        data: Raw UTF-8 encoded JSON.
+
+    Returns:
+        Any: Decoded JSON value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialise ``data`` as two-space indented JSON bytes.
+
+    Both backends write non-ASCII text as raw UTF-8.  Values ``orjson``
+    refuses, such as integers beyond 64 bits or non-string keys, are
+    encoded with the stdlib instead.  The backends still differ on
+    non-finite floats: ``orjson`` writes ``NaN``/``Infinity`` as ``null``
+    while the stdlib writes them bare.
+
+    Args:
+        data: JSON-compatible value to encode.
+
+    Returns:
+        bytes: UTF-8 encoded document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _toml_loads(data: bytes) -> dict[str, Any]:
+    """Parse a UTF-8 encoded TOML document.
+
+    Args:
+        data: Raw TOML bytes.
+
+    Returns:
+        dict[str, Any]: Decoded TOML table.
+    """
+    return tomllib.loads(data.decode("utf-8"))
+
+
+def _read_cached(
+    path: Path,
+    parse: Callable[[bytes], dict[str, Any]],
+    needle: bytes | None = None,
+) -> dict[str, Any]:
+    """Return the parsed document at ``path``, reusing the cached parse.
+
+    The entry is reused while the file's modification time, size and inode
+    are unchanged.  The returned mapping is shared between callers and must
+    not be mutated; use :func:`copy.deepcopy` before editing it.
+
+    Args:
+        path: Configuration file to read.
+        parse: Callback decoding the raw file bytes.
+        needle: Optional byte string the caller is looking for.  When the
+            uncached file does not contain it, parsing is skipped and an
+            empty dict is returned without populating the cache.
+
+    Returns:
+        dict[str, Any]: Parsed document, or an empty dict when ``path`` is
+        missing (or lacks ``needle``).
+    """
+    try:
+        signature = stat_signature(path)
+    except FileNotFoundError:
+        _CONFIG_CACHE.pop(path, None)
+        return {}
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    data = path.read_bytes()
+    if needle is not None and needle not in data:
+        return {}
+    document = parse(data)
+    _CONFIG_CACHE[path] = (signature, document)
+    return document
+
+
+def _invalidate_cached(path: Path) -> None:
+    """Drop any cached parse of ``path`` after it has been rewritten.
+
+    Args:
+        path: Configuration file whose cache entry should be discarded.
+    """
+    _CONFIG_CACHE.pop(path, None)
+
+
+# copy_file_range failures that mean "not supported here" rather than a real I/O error
+_COPY_UNSUPPORTED = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP})
+# Linux ioctl request that makes the destination a copy-on-write clone of the source
+_FICLONE = 0x40049409
+
+
+def _clone_file(src_fd: int, dst_fd: int) -> bool:
+    """Try to reflink ``src_fd`` into the empty ``dst_fd`` without copying data.
+
+    Succeeds on copy-on-write filesystems such as btrfs or XFS.  Unlike a
+    hard link, the clone is an independent file, so later in-place edits of
+    either side never leak into the other.
+
+    Args:
+        src_fd: Descriptor opened for reading on the source file.
+        dst_fd: Descriptor opened for writing on the truncated destination.
+
+    Returns:
+        bool: ``True`` when the clone was created.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except OSError:
+        return False
+    return True
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst`` preserving permission bits and timestamps.
+
+    Prefers a reflink clone, then the in-kernel :func:`os.copy_file_range`,
+    and falls back to :func:`shutil.copy2` on other platforms or filesystems.
+
+    Args:
+        src: File to copy.
+        dst: Destination path, created or truncated.
+
+    Raises:
+        FileNotFoundError: If ``src`` does not exist.
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dst)
+        return
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        stat = os.fstat(src_fd)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            remaining = 0 if _clone_file(src_fd, dst_fd) else stat.st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            os.fchmod(dst_fd, stat.st_mode & 0o7777)
+            os.utime(dst_fd, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        finally:
+            os.close(dst_fd)
+    except OSError as error:
+        if error.errno not in _COPY_UNSUPPORTED:
+            raise
+        shutil.copy2(src, dst)
+    finally:
+        os.close(src_fd)
+
+
+def _write_file(path: Path, payload: bytes, mode: int | None = None) -> None:
+    """Write ``payload`` to ``path`` with raw syscalls.
+
+    Args:
+        path: File to create or truncate.
+        payload: Complete file contents.
+        mode: Permission bits to apply; ``None`` leaves a new file to the
+            umask, like :meth:`Path.write_bytes`.
+
+    Raises:
+        FileNotFoundError: If the parent directory does not exist.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+        if mode is not None and hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+    finally:
+        os.close(fd)
+
 
 class ConfigManager:
     """Encapsulate Claude/Codex configuration mutations with rollback safety.
@@ -37,6 +249,11 @@ class ConfigManager:
         self.home = home
         self.claude_config = home / ".claude" / "settings.json"
         self.codex_config = home / ".codex" / "config.toml"
+        self.claude_hook_path = home / ".claude" / "hooks" / "vocl-go.py"
+        self.codex_hook_path = home / ".codex" / "voco-go.py"
+        # Rendered forms written into the tool configs
+        self._claude_hook_command = f'"{self.claude_hook_path}" "$CLAUDE_PROJECT_DIR"'
+        self._codex_hook_entry = str(self.codex_hook_path)
 
     # Public helpers
     def backup_config(self, config_path: Path) -> Path | None:
@@ -49,13 +266,13 @@ class ConfigManager:
             Path | None: Path to the backup file, or ``None`` when the source
             file does not yet exist.
         """
-        if not config_path.exists():
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        backup = config_path.with_suffix(f"{config_path.suffix}.backup.{stamp}")
+        try:
+            _fast_copy(config_path, backup)
+        except FileNotFoundError:
             return None
-        backup = config_path.with_suffix(
-            f"{config_path.suffix}.backup.{datetime.now():%Y%m%d_%H%M%S}"
-        )
-        shutil.copy2(config_path, backup)
-        logger.debug("Backed up %s to %s", config_path, backup)
+        logger.debug("Backed up {} to {}", config_path, backup)
         return backup
 
     def is_claude_hook_enabled(self) -> bool:
@@ -64,19 +281,26 @@ class ConfigManager:
         Returns:
             bool: ``True`` if the hook configuration references the helper.
         """
-        if not self.claude_config.exists():
-            return False
         try:
-            with open(self.claude_config, encoding="utf-8") as handle:
-                hooks = json.load(handle).get("hooks", {})
-        except Exception as error:  # pragma: no cover - defensive guard
-            logger.debug("Error checking Claude hook: %s", error)
+            document = _read_cached(self.claude_config, _json_loads, needle=b"vocl-go")
+        except (OSError, ValueError) as error:
+            logger.debug("Error checking Claude hook: {}", error)
+            return False
+        if not isinstance(document, dict):
+            return False
+        hooks = document.get("hooks")
+        stop = hooks.get("Stop") if isinstance(hooks, dict) else None
+        if not isinstance(stop, list):
             return False
-        return any(
-            "vocl-go" in inner.get("command", "")
-            for hook in hooks.get("Stop", [])
-            for inner in hook.get("hooks", [])
-        )
+        for hook in stop:
+            inner_hooks = hook.get("hooks") if isinstance(hook, dict) else None
+            if not isinstance(inner_hooks, list):
+                continue
+            for inner in inner_hooks:
+                command = inner.get("command") if isinstance(inner, dict) else None
+                if isinstance(command, str) and "vocl-go" in command:
+                    return True
+        return False
 
     def is_codex_hook_enabled(self) -> bool:
         """Check whether the Codex notify hook points to voco-go.
@@ -85,30 +309,27 @@ class ConfigManager:
             bool: ``True`` when at least one notify entry references the
             helper script.
         """
-        if not self.codex_config.exists():
-            return False
         try:
-            with open(self.codex_config, "rb") as handle:
-                notify = tomli.load(handle).get("notify", [])
-        except Exception as error:  # pragma: no cover - defensive guard
-            logger.debug("Error checking Codex hook: %s", error)
+            document = _read_cached(self.codex_config, _toml_loads, needle=b"voco-go")
+        except (OSError, ValueError) as error:
+            logger.debug("Error checking Codex hook: {}", error)
+            return False
+        notify = document.get("notify")
+        if not isinstance(notify, list):
             return False
-        return any("voco-go" in item for item in notify)
+        return any(isinstance(item, str) and "voco-go" in item for item in notify)
 
     def enable_claude_hook(self) -> None:
         """Write a Claude Stop hook that launches ``vocl-go``."""
         config = self._load_json(self.claude_config)
-        command = f'"{self.home / ".claude" / "hooks" / "vocl-go.py"}" "$CLAUDE_PROJECT_DIR"'
         config.setdefault("hooks", {})["Stop"] = [
-            {"hooks": [{"type": "command", "command": command}]}
+            {"hooks": [{"type": "command", "command": self._claude_hook_command}]}
         ]
         self._write_json_with_rollback(self.claude_config, config)
         logger.info("Claude Stop hook enabled")
 
     def disable_claude_hook(self) -> None:
         """Remove the Claude Stop hook if present."""
-        if not self.claude_config.exists():
-            return
         config = self._load_json(self.claude_config)
         if "hooks" in config and "Stop" in config["hooks"]:
             del config["hooks"]["Stop"]
@@ -121,14 +342,12 @@ class ConfigManager:
     def enable_codex_hook(self) -> None:
         """Write a Codex "notify" hook pointing at ``voco-go``."""
         config = self._load_toml(self.codex_config)
-        config["notify"] = [str(self.home / ".codex" / "voco-go.py")]
+        config["notify"] = [self._codex_hook_entry]
         self._write_toml_with_rollback(self.codex_config, config)
         logger.info("Codex notify hook enabled")
 
     def disable_codex_hook(self) -> None:
         """Remove the Codex notify hook when it exists."""
-        if not self.codex_config.exists():
-            return
         config = self._load_toml(self.codex_config)
         if "notify" in config:
             del config["notify"]
@@ -139,51 +358,82 @@ class ConfigManager:
     def is_tool_installed(self, tool: str) -> bool:
         """Return whether ``tool`` is discoverable in ``PATH``.
 
+        Lookups are memoised per ``PATH`` value; see :meth:`clear_caches`.
+
         Args:
-            tool: Command name to probe via ``which``.
+            tool: Command name to probe.
 
         Returns:
             bool: ``True`` if the command resolves successfully.
         """
-        from subprocess import run  # Local import keeps module scope minimal
+        return which(tool, os.environ.get("PATH")) is not None
 
-        try:
-            return run(["which", tool], capture_output=True, text=True, check=False).returncode == 0
-        except Exception:  # pragma: no cover - defensive guard
-            return False
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Forget memoised ``PATH`` lookups and parsed config documents.
+
+        Useful after installing a tool or editing configs in ways the file
+        signature cannot observe.
+        """
+        which.cache_clear()
+        _CONFIG_CACHE.clear()
+
+    def status_snapshot(self) -> dict[str, dict[str, bool]]:
+        """Collect hook and install state for every supported tool in one pass.
+
+        Each hook configuration file is read at most once and ``PATH`` is
+        probed through the memoised :meth:`is_tool_installed` lookup.
+
+        Returns:
+            dict[str, dict[str, bool]]: Mapping of tool name to
+            ``hook_enabled`` and ``installed`` flags.
+        """
+        hooks = {
+            "claude": self.is_claude_hook_enabled(),
+            "codex": self.is_codex_hook_enabled(),
+            "gemini": False,
+        }
+        return {
+            tool: {"hook_enabled": enabled, "installed": self.is_tool_installed(tool)}
+            for tool, enabled in hooks.items()
+        }
 
     def backup_legacy_configs(self) -> None:
         """Create backups for all known legacy configuration files."""
         for path in (
-            self.home / ".claude" / "settings.json",
-            self.home / ".codex" / "config.toml",
+            self.claude_config,
+            self.codex_config,
             self.home / ".gemini" / "config.json",
         ):
-            if path.exists():
-                self.backup_config(path)
+            self.backup_config(path)
 
     def migrate_from_legacy(self) -> None:
-        """Rewrite legacy continuation hooks to reference the new helpers."""
-        if self.claude_config.exists():
-            self.backup_config(self.claude_config)
-            config = self._load_json(self.claude_config)
-            hook_path = str(self.home / ".claude" / "hooks" / "vocl-go.py")
+        """Rewrite legacy continuation hooks to reference the new helpers.
+
+        Files that never mention the legacy scripts are neither parsed nor
+        rewritten, so re-running the migration is cheap and side-effect
+        free.  Each rewrite takes its backup inside the atomic write.
+        """
+        legacy = _read_cached(self.claude_config, _json_loads, needle=b"claude4ever.py")
+        if legacy:
+            config = copy.deepcopy(legacy)
+            changed = False
             for hook in config.get("hooks", {}).get("Stop", []):
                 for inner in hook.get("hooks", []):
                     if "claude4ever.py" in inner.get("command", ""):
-                        inner["command"] = f'"{hook_path}" "$CLAUDE_PROJECT_DIR"'
-            self._write_json_with_rollback(self.claude_config, config)
-
-        if self.codex_config.exists():
-            self.backup_config(self.codex_config)
-            config = self._load_toml(self.codex_config)
-            hook_path = str(self.home / ".codex" / "voco-go.py")
-            values = [
-                hook_path if "codex4ever.py" in item else item for item in config.get("notify", [])
+                        inner["command"] = self._claude_hook_command
+                        changed = True
+            if changed:
+                self._write_json_with_rollback(self.claude_config, config)
+
+        legacy = _read_cached(self.codex_config, _toml_loads, needle=b"codex4ever.py")
+        notify = legacy.get("notify", [])
+        if any("codex4ever.py" in item for item in notify):
+            config = dict(legacy)
+            config["notify"] = [
+                self._codex_hook_entry if "codex4ever.py" in item else item for item in notify
             ]
-            if values:
-                config["notify"] = values
-                self._write_toml_with_rollback(self.codex_config, config)
+            self._write_toml_with_rollback(self.codex_config, config)
 
     def setup_configs(self) -> None:
         """Ensure default configuration files exist for Claude and Codex."""
@@ -205,12 +455,10 @@ class ConfigManager:
             path: File to read.
 
         Returns:
-            dict[str, Any]: Parsed document or an empty dictionary.
+            dict[str, Any]: Private copy of the parsed document, safe to
+            mutate, or an empty dictionary.
         """
-        if path.exists():
-            with open(path, encoding="utf-8") as handle:
-                return json.load(handle)
-        return {}
+        return copy.deepcopy(_read_cached(path, _json_loads))
 
     def _load_toml(self, path: Path) -> dict[str, Any]:
         """Load TOML document from ``path`` returning an empty dict on miss.
@@ -219,12 +467,12 @@ class ConfigManager:
             path: File to read.
 
         Returns:
-            dict[str, Any]: Parsed document or an empty dictionary.
+            dict[str, Any]: Shallow copy of the parsed document, or an empty
+            dictionary.  Codex edits only add, replace or delete top-level
+            keys such as ``notify``, so nested tables stay shared with the
+            cache and must not be mutated in place.
         """
-        if path.exists():
-            with open(path, "rb") as handle:
-                return tomli.load(handle)
-        return {}
+        return dict(_read_cached(path, _toml_loads))
 
     def _write_json_with_rollback(self, target: Path, data: dict[str, Any]) -> None:
         """Persist ``data`` to ``target`` as JSON using rollback semantics.
@@ -233,12 +481,7 @@ class ConfigManager:
             target: File that should receive the JSON document.
             data: Payload to serialise.
         """
-
-        def write_json(path: Path) -> None:
-            with open(path, "w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2)
-
-        self._write_with_rollback(target, write_json, self._validate_json_file)
+        self._write_with_rollback(target, _json_dumps(data), self._validate_json_payload)
 
     def _write_toml_with_rollback(self, target: Path, data: dict[str, Any]) -> None:
         """Persist ``data`` to ``target`` as TOML using rollback semantics.
@@ -247,71 +490,70 @@ class ConfigManager:
             target: File that should receive the TOML document.
             data: Payload to serialise.
         """
-
-        def write_toml(path: Path) -> None:
-            with open(path, "wb") as handle:
-                tomli_w.dump(data, handle)
-
-        self._write_with_rollback(target, write_toml, self._validate_toml_file)
+        payload = tomli_w.dumps(data).encode("utf-8")
+        self._write_with_rollback(target, payload, self._validate_toml_payload)
 
     def _write_with_rollback(
         self,
         target: Path,
-        write_func: Callable[[Path], None],
-        validate_func: Callable[[Path], None],
+        payload: bytes,
+        validate_func: Callable[[bytes], None],
     ) -> None:
-        """Write to ``target`` atomically by validating a temporary file first.
+        """Write ``payload`` to ``target`` atomically after validating it in memory.
+
+        The original file is only ever swapped out by the final
+        :func:`os.replace`, so a failure at any earlier step leaves it
+        untouched and there is nothing to roll back.  A timestamped backup is
+        still taken once the payload has validated, for users who want to
+        undo a successful change by hand.
 
         Args:
             target: File that should be replaced.
-            write_func: Callback that writes the payload to the temporary file.
-            validate_func: Callback that validates the temporary file contents.
+            payload: Serialised document to persist.
+            validate_func: Callback that parses ``payload`` and raises when it
+                is malformed.
 
         Raises:
-            Exception: Propagates exceptions from ``write_func`` or
-                ``validate_func`` after restoring the backup.
+            Exception: Propagates exceptions from ``validate_func`` or the
+                filesystem; ``target`` is unchanged in that case.
         """
-        backup = self.backup_config(target)
+        validate_func(payload)
+        self.backup_config(target)
+        try:
+            # The replacement keeps the permissions the user gave the original
+            mode: int | None = os.stat(target).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = None
         tmp_path = target.with_suffix(target.suffix + ".tmp")
-        if tmp_path.exists():
-            tmp_path.unlink()
         try:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            write_func(tmp_path)
-            validate_func(tmp_path)
-            tmp_path.replace(target)
+            try:
+                _write_file(tmp_path, payload, mode)  # truncates any stale temp file
+            except FileNotFoundError:
+                # First write into a fresh config directory
+                target.parent.mkdir(parents=True, exist_ok=True)
+                _write_file(tmp_path, payload, mode)
+            os.replace(tmp_path, target)
         except Exception:
-            if tmp_path.exists():
-                tmp_path.unlink()
-            self._restore_from_backup(target, backup)
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
             raise
+        finally:
+            _invalidate_cached(target)
 
-    def _validate_json_file(self, path: Path) -> None:
-        """Read ``path`` ensuring it contains valid JSON.
-
-        Args:
-            path: File whose JSON structure should be validated.
-        """
-        with open(path, encoding="utf-8") as handle:
-            json.load(handle)
-
-    def _validate_toml_file(self, path: Path) -> None:
-        """Read ``path`` ensuring it contains valid TOML.
+    def _validate_json_payload(self, payload: bytes) -> None:
+        """Parse ``payload`` ensuring it contains valid JSON.
 
         Args:
-            path: File whose TOML structure should be validated.
+            payload: Serialised JSON document about to be written.
         """
-        with open(path, "rb") as handle:
-            tomli.load(handle)
+        _json_loads(payload)
 
-    def _restore_from_backup(self, target: Path, backup: Path | None) -> None:
-        """Restore ``target`` from ``backup`` or remove it when restoration fails.
+    def _validate_toml_payload(self, payload: bytes) -> None:
+        """Parse ``payload`` ensuring it contains valid TOML.
 
         Args:
-            target: File to restore.
-            backup: Backup file previously created by :meth:`backup_config`.
+            payload: Serialised TOML document about to be written.
         """
-        if backup and backup.exists():
-            shutil.copy2(backup, target)
-        elif backup is None and target.exists():
-            target.unlink()
+        _toml_loads(payload)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# this_file: src/vexy_overnight/file_signature.py
+"""Identify on-disk file versions for the per-process parse caches.
+
+Config documents, user settings, and the TODO/PLAN hints read by hook
+scripts are all cached against the same signature, so an edit or atomic
+replacement of any of them is detected the same way.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# (st_mtime_ns, st_size, st_ino); the inode catches same-sized files swapped
+# in within one timestamp tick
+FileSignature = tuple[int, int, int]
+
+
+def stat_signature(path: str | os.PathLike[str] | Path) -> FileSignature:
+    """Return the signature identifying the current version of ``path``.
+
+    Args:
+        path: File to inspect.
+
+    Returns:
+        FileSignature: ``(st_mtime_ns, st_size, st_ino)`` of the file.
+
+    Raises:
+        OSError: If ``path`` cannot be stat'ed, e.g. ``FileNotFoundError``.
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+__all__ = ["FileSignature", "stat_signature"]
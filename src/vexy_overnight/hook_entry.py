@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# this_file: src/vexy_overnight/hook_entry.py
+"""Shared entry point for the installed continuation hook scripts.
+
+The ``*-go.py`` scripts rendered by :class:`~vexy_overnight.hooks.HookManager`
+only describe their install-time settings as a :class:`HookSpec` and call
+:func:`run_hook`.  Payload parsing, project discovery, and the hand-off to the
+helper live here, so every tool shares one module (and one cached bytecode
+file) instead of carrying its own copy of the logic.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .hook_runtime import (
+    DEFAULT_PROMPT_FALLBACK,
+    build_prompt,
+    build_target_command,
+    continuation_enabled,
+    load_settings,
+    prepare_env_updates,
+    resolve_target,
+    spawn_helper,
+    write_config,
+)
+
+
+@dataclass(frozen=True)
+class HookSpec:
+    """Install-time settings baked into a rendered hook script."""
+
+    source_tool: str
+    helper_name: str
+    config_filename: str
+    terminal_env_key: str
+    force_direct_env_key: str
+    prompt_fallback: str = DEFAULT_PROMPT_FALLBACK
+    # Environment variable naming the project directory (Claude)
+    env_project_key: str | None = None
+    # Session log directory relative to HOME, scanned for a cwd (Codex)
+    sessions_relative: str | None = None
+
+
+def run_hook(spec: HookSpec, script_dir: Path) -> None:
+    """Handle a hook event: build the continuation and launch its helper.
+
+    Args:
+        spec: Settings rendered into the calling hook script.
+        script_dir: Directory holding the hook, its helper, and its config.
+    """
+    payload = read_payload()
+    project_dir = determine_project_dir(spec, payload)
+    settings = load_settings()
+    config_path = script_dir / spec.config_filename
+    if not continuation_enabled(settings, spec.source_tool):
+        _remove_stale_config(config_path)
+        return
+
+    target_tool = resolve_target(settings, spec.source_tool)
+    prompt = build_prompt(
+        settings, spec.source_tool, target_tool, project_dir, spec.prompt_fallback
+    )
+    command = build_target_command(target_tool, project_dir, prompt)
+    env_updates = prepare_env_updates(settings, spec.source_tool, target_tool, prompt, project_dir)
+    write_config(config_path, command, project_dir, env_updates)
+
+    helper_script = script_dir / spec.helper_name
+    if not helper_script.exists():
+        sys.stderr.write(f"Helper script {spec.helper_name} is missing. Re-run vomgr install.\n")
+        sys.exit(1)
+
+    spawn_helper(
+        helper_script,
+        project_dir,
+        settings,
+        target_tool,
+        terminal_env_key=spec.terminal_env_key,
+        force_direct=os.environ.get(spec.force_direct_env_key) == "1",
+    )
+
+
+def read_payload() -> dict[str, Any]:
+    """Return the JSON payload streamed to the hook via stdin.
+
+    Returns:
+        dict[str, Any]: Parsed payload or an empty dictionary when stdin is
+        empty or parsing fails.
+    """
+    try:
+        raw = sys.stdin.read()
+    except Exception:
+        return {}
+    if not raw.strip():
+        return {}
+    try:
+        payload = json.loads(raw)
+    except Exception:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def determine_project_dir(spec: HookSpec, payload: dict[str, Any]) -> Path:
+    """Resolve the project directory for the tool described by ``spec``.
+
+    Args:
+        spec: Settings rendered into the calling hook script.
+        payload: Payload dictionary supplied by the CLI hook.
+
+    Returns:
+        Path: Directory that should be considered the active project.
+    """
+    if spec.sessions_relative is not None:
+        return _codex_project_dir(payload, Path.home() / spec.sessions_relative)
+    return _claude_project_dir(payload, spec.env_project_key)
+
+
+def _claude_project_dir(payload: dict[str, Any], env_project_key: str | None) -> Path:
+    """Resolve the Claude project directory using multiple fallbacks.
+
+    Args:
+        payload: Payload dictionary supplied by the Claude CLI hook.
+        env_project_key: Environment variable that may name the project.
+
+    Returns:
+        Path: Directory that should be considered the active project.
+    """
+    project = _ensure_path(os.environ.get(env_project_key) if env_project_key else None)
+    if project is not None:
+        return project
+
+    candidate = payload.get("project_dir") or payload.get("cwd")
+    if isinstance(candidate, str):
+        project = _ensure_path(candidate.strip())
+        if project is not None:
+            return project
+
+    return Path(os.environ.get("PWD", os.getcwd()))
+
+
+def _codex_project_dir(payload: dict[str, Any], sessions_root: Path) -> Path:
+    """Infer the Codex working directory from payload, history, or defaults.
+
+    Args:
+        payload: Payload dictionary provided by the Codex hook.
+        sessions_root: Directory holding Codex session ``.jsonl`` logs.
+
+    Returns:
+        Path: Directory that should be used as the launch context.
+    """
+    context = _context_to_mapping(payload.get("context"))
+    candidate = context.get("cwd") or context.get("working_directory")
+    project = _ensure_path(candidate if isinstance(candidate, str) else None)
+    if project is not None:
+        return project
+
+    fallback = payload.get("cwd")
+    project = _ensure_path(fallback if isinstance(fallback, str) else None)
+    if project is not None:
+        return project
+
+    project = _latest_session_directory(sessions_root)
+    if project is not None:
+        return project
+
+    project = _ensure_path(os.environ.get("PWD"))
+    if project is not None:
+        return project
+
+    return Path(os.getcwd())
+
+
+def _ensure_path(value: str | None) -> Path | None:
+    """Expand ``value`` to a path if it exists on disk.
+
+    Args:
+        value: String path candidate or ``None``.
+
+    Returns:
+        Path | None: Expanded path when the directory exists.
+    """
+    if not value:
+        return None
+    path = Path(value).expanduser()
+    if path.exists():
+        return path
+    return None
+
+
+def _context_to_mapping(context: Any) -> dict[str, Any]:
+    """Normalise various context representations into a dictionary.
+
+    Args:
+        context: Raw context value from Codex payloads.
+
+    Returns:
+        dict[str, Any]: Dictionary representation with helpful keys.
+    """
+    if isinstance(context, dict):
+        return context
+    if isinstance(context, str):
+        stripped = context.strip()
+        if not stripped:
+            return {}
+        try:
+            loaded = json.loads(stripped)
+            if isinstance(loaded, dict):
+                return loaded
+        except Exception:
+            path = _ensure_path(stripped)
+            if path is not None:
+                return {"cwd": str(path)}
+    return {}
+
+
+def _latest_session_directory(sessions_root: Path) -> Path | None:
+    """Return the most recent Codex session working directory if available.
+
+    The newest log is found with a single linear pass; older logs are only
+    sorted and scanned when it records no usable directory.
+
+    Args:
+        sessions_root: Directory holding Codex session ``.jsonl`` logs.
+
+    Returns:
+        Path | None: Directory parsed from session logs or ``None`` when absent.
+    """
+    candidates: list[tuple[float, str]] = []
+    try:
+        with os.scandir(sessions_root) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jsonl"):
+                    continue
+                try:
+                    if entry.is_file():
+                        candidates.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    if not candidates:
+        return None
+
+    newest = max(candidates)
+    path = _read_session_cwd(newest[1])
+    if path is not None:
+        return path
+    candidates.remove(newest)
+    candidates.sort(reverse=True)
+    for _, stream in candidates:
+        path = _read_session_cwd(stream)
+        if path is not None:
+            return path
+    return None
+
+
+def _read_session_cwd(stream: str) -> Path | None:
+    """Return the working directory recorded in the session log at ``stream``.
+
+    Args:
+        stream: Path to a session ``.jsonl`` file.
+
+    Returns:
+        Path | None: Recorded directory, or ``None`` when unreadable or absent.
+    """
+    try:
+        return _session_cwd(Path(stream).read_bytes())
+    except Exception:
+        return None
+
+
+def _session_cwd(data: bytes) -> Path | None:
+    """Return the first existing ``cwd`` recorded in a session JSONL stream.
+
+    Only lines containing the ``"cwd"`` key text are decoded, so large
+    session logs cost a byte scan rather than one JSON parse per record.
+
+    Args:
+        data: Raw contents of a session ``.jsonl`` file.
+
+    Returns:
+        Path | None: Directory from the earliest record whose ``cwd`` exists.
+    """
+    index = data.find(b'"cwd"')
+    while index != -1:
+        start = data.rfind(b"\n", 0, index) + 1
+        end = data.find(b"\n", index)
+        if end == -1:
+            end = len(data)
+        try:
+            record = json.loads(data[start:end])
+        except Exception:
+            record = None
+        if isinstance(record, dict):
+            cwd = record.get("cwd")
+            path = _ensure_path(str(cwd)) if isinstance(cwd, str | os.PathLike) else None
+            if path is not None:
+                return path
+        index = data.find(b'"cwd"', end)
+    return None
+
+
+def _remove_stale_config(config_path: Path) -> None:
+    """Delete a persisted helper config while continuation is disabled.
+
+    Args:
+        config_path: Generated configuration file next to the hook.
+    """
+    try:
+        config_path.unlink()
+    except FileNotFoundError:
+        pass
+    except Exception:  # pragma: no cover - best-effort cleanup
+        pass
+
+
+__all__ = ["HookSpec", "determine_project_dir", "read_payload", "run_hook"]
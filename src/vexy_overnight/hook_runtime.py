@@ -5,24 +5,28 @@
 The continuation hooks call into these utilities to load user preferences,
 compose prompts, spawn helper processes, and emit notifications.  The module
 is intentionally dependency-light because it executes inside external CLI
-environments.
+environments; process, quoting and temp-file modules are imported only by the
+helpers that launch something.
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import os
-import platform
-import shlex
-import shutil
-import subprocess
+import re
+import string
 import sys
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .file_signature import FileSignature, stat_signature
+from .path_lookup import which
+
 try:
     from .user_settings import (
+        _CONTINUATION_TOOL_SET,
         CONTINUATION_TOOLS,
         ContinuationPrefs,
         NotificationPrefs,
@@ -32,6 +36,7 @@ try:
     )
 except Exception:  # pragma: no cover - defensive fallback when package import fails
     CONTINUATION_TOOLS = ("claude", "codex", "gemini")
+    _CONTINUATION_TOOL_SET = frozenset(CONTINUATION_TOOLS)
 
     _DEFAULT_PROMPTS = {
         "claude": "Continue work in the next tool. Outstanding tasks:\n{todo}",
@@ -146,6 +151,9 @@ _DEFAULT_SETTINGS = UserSettings.default()
 DEFAULT_PROMPTS = _DEFAULT_SETTINGS.prompts
 DEFAULT_TERMINALS = _DEFAULT_SETTINGS.terminals.defaults
 DEFAULT_PROMPT_FALLBACK = "Continue working on the current task"
+# Host platform key ("darwin", "linux", "windows") used for terminal lookups;
+# matches platform.system().lower() without importing ``platform``
+_PLATFORM_KEY = "windows" if sys.platform == "win32" else os.uname().sysname.lower()
 
 
 def load_settings() -> UserSettings:
@@ -188,7 +196,13 @@ def resolve_target(settings: UserSettings, tool: str) -> str:
     """
     prefs = settings.continuations.get(tool)
     target = getattr(prefs, "target", "claude") if prefs else "claude"
-    return target if target in CONTINUATION_TOOLS else "claude"
+    return target if target in _CONTINUATION_TOOL_SET else "claude"
+
+
+# Unchecked Markdown task items, allowing leading indentation
+_TODO_LINE = re.compile(rb"(?m)^[^\S\n]*- \[ \][^\n]*")
+# TODO.md is read in blocks of this size until five items are found
+_TODO_READ_SIZE = 65536
 
 
 def _collect_todo_lines(project_dir: Path) -> list[str]:
@@ -201,13 +215,44 @@ def _collect_todo_lines(project_dir: Path) -> list[str]:
         list[str]: Up to five TODO lines starting with ``"- [ ]"``.
     """
     todo_path = project_dir / "TODO.md"
-    if not todo_path.exists():
-        return []
     try:
-        lines = [line.strip() for line in todo_path.read_text(encoding="utf-8").splitlines()]
-    except Exception:  # pragma: no cover - IO failures
+        signature = stat_signature(todo_path)
+    except OSError:
         return []
-    return [line for line in lines if line.startswith("- [ ]")][:5]
+    return list(_todo_lines_cached(str(todo_path), signature))
+
+
+@functools.lru_cache(maxsize=64)
+def _todo_lines_cached(path: str, signature: FileSignature) -> tuple[str, ...]:
+    """Read unchecked TODO entries, memoised per file version.
+
+    Args:
+        path: ``TODO.md`` location.
+        signature: File version, used only as part of the cache key.
+
+    Returns:
+        tuple[str, ...]: Up to five stripped ``"- [ ]"`` lines.
+    """
+    found: list[str] = []
+    pending = b""
+    try:
+        with open(path, "rb", buffering=0) as handle:
+            while True:
+                chunk = handle.read(_TODO_READ_SIZE)
+                block = pending + chunk
+                if chunk:
+                    # Hold back the trailing partial line for the next block
+                    cut = block.rfind(b"\n") + 1
+                    block, pending = block[:cut], block[cut:]
+                # Only matched lines are decoded
+                for match in _TODO_LINE.finditer(block):
+                    found.append(match.group().decode("utf-8", "replace").strip())
+                    if len(found) == 5:
+                        return tuple(found)
+                if not chunk:
+                    return tuple(found)
+    except OSError:  # pragma: no cover - IO failures
+        return tuple(found)
 
 
 def _collect_plan_hint(project_dir: Path) -> str:
@@ -220,13 +265,35 @@ def _collect_plan_hint(project_dir: Path) -> str:
         str: Up to five non-empty lines joined by newlines.
     """
     plan_path = project_dir / "PLAN.md"
-    if not plan_path.exists():
+    try:
+        signature = stat_signature(plan_path)
+    except OSError:
         return ""
+    return _plan_hint_cached(str(plan_path), signature)
+
+
+@functools.lru_cache(maxsize=64)
+def _plan_hint_cached(path: str, signature: FileSignature) -> str:
+    """Read the leading ``PLAN.md`` snippet, memoised per file version.
+
+    Args:
+        path: ``PLAN.md`` location.
+        signature: File version, used only as part of the cache key.
+
+    Returns:
+        str: Up to five non-empty stripped lines joined by newlines.
+    """
+    snippet: list[str] = []
     try:
-        lines = plan_path.read_text(encoding="utf-8").splitlines()
+        with open(path, encoding="utf-8") as handle:
+            for raw in handle:
+                line = raw.strip()
+                if line:
+                    snippet.append(line)
+                    if len(snippet) == 5:
+                        break
     except Exception:  # pragma: no cover - IO failures
         return ""
-    snippet = [line.strip() for line in lines if line.strip()][:5]
     return "\n".join(snippet)
 
 
@@ -248,34 +315,63 @@ def build_prompt(
 
     Returns:
         str: Fully formatted prompt ready to be supplied to the launcher.
+        ``TODO.md`` and ``PLAN.md`` are only read when the template uses
+        ``{todo}`` or ``{plan}``.
     """
     template = settings.prompts.get(source_tool) or DEFAULT_PROMPTS.get(source_tool) or fallback
-    todo_lines = _collect_todo_lines(project_dir)
-    todo_text = "\n".join(todo_lines) if todo_lines else "No open TODO items."
-    plan_text = _collect_plan_hint(project_dir) or "No plan summary available."
-    values = {
-        "todo": todo_text,
-        "plan": plan_text,
-        "target": target_tool,
-        "source": source_tool,
-    }
+    fields, literal = _compile_template(template)
+    if literal is not None:
+        return literal
+    values = {"target": target_tool, "source": source_tool}
+    if "todo" in fields:
+        todo_lines = _collect_todo_lines(project_dir)
+        values["todo"] = "\n".join(todo_lines) if todo_lines else "No open TODO items."
+    if "plan" in fields:
+        values["plan"] = _collect_plan_hint(project_dir) or "No plan summary available."
     try:
         return template.format(**values)
     except Exception:  # pragma: no cover - formatting guard
         return template
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_template(template: str) -> tuple[frozenset[str], str | None]:
+    """Parse ``template`` once into its field names and any constant rendering.
+
+    Args:
+        template: ``str.format`` template configured for a tool.
+
+    Returns:
+        tuple[frozenset[str], str | None]: Top-level replacement field names
+        such as ``"todo"`` or ``"plan"``, and the fully rendered text when the
+        template has no fields (``None`` otherwise).  Unparseable templates
+        render as themselves, matching the formatting fallback.
+    """
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return frozenset(), template
+    fields = frozenset(
+        name.partition(".")[0].partition("[")[0] for _, name, _, _ in parsed if name is not None
+    )
+    if fields:
+        return fields, None
+    return fields, "".join(text for text, _, _, _ in parsed)
+
+
 def resolve_executable(command_name: str) -> str:
     """Return an absolute path for ``command_name`` when discoverable.
 
+    Hooks resolve the same CLI on every continuation, so the memoised
+    :func:`~vexy_overnight.path_lookup.which` is used.
+
     Args:
-        command_name: Command to resolve via :func:`shutil.which`.
+        command_name: Command to resolve on the current ``PATH``.
 
     Returns:
         str: Absolute path when found, otherwise the original name.
     """
-    resolved = shutil.which(command_name)
-    return resolved or command_name
+    return which(command_name, os.environ.get("PATH")) or command_name
 
 
 def build_target_command(target_tool: str, project_dir: Path, prompt: str) -> list[str]:
@@ -331,24 +427,26 @@ def prepare_env_updates(
         project_dir: Working directory used by the helper.
 
     Returns:
-        dict[str, str]: Mapping of environment variable names to values.
+        dict[str, str]: Mapping of environment variable names to values.  The
+        notification message is only rendered when notifications are enabled.
     """
     notifications = settings.notifications
-    try:
-        message = notifications.message.format(target=target_tool, source=source_tool)
-    except Exception:  # pragma: no cover - formatting guard
-        message = notifications.message
     env_updates: dict[str, str] = {
         "VOMGR_TARGET_TOOL": target_tool,
         "VOMGR_SOURCE_TOOL": source_tool,
         "VOMGR_PROMPT": prompt,
         "VOMGR_PROJECT_DIR": str(project_dir),
         "VOMGR_NOTIFICATION_ENABLED": "1" if notifications.enabled else "0",
-        "VOMGR_NOTIFICATION_MESSAGE": message,
         "VOMGR_NOTIFICATION_SOUND": notifications.sound,
         "VOMGR_KILL_OLD": "1" if settings.kill_old_sessions else "0",
     }
-    return {key: value for key, value in env_updates.items() if value is not None}
+    if notifications.enabled:
+        try:
+            message = notifications.message.format(target=target_tool, source=source_tool)
+        except Exception:  # pragma: no cover - formatting guard
+            message = notifications.message
+        env_updates["VOMGR_NOTIFICATION_MESSAGE"] = message
+    return env_updates
 
 
 def write_config(
@@ -370,7 +468,8 @@ def write_config(
         "cwd": str(project_dir),
         "env": {str(key): str(value) for key, value in env_updates.items()},
     }
-    config_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # Only the helper reads this file, so skip indentation and padding
+    config_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
 
 
 def spawn_helper(
@@ -398,13 +497,15 @@ def spawn_helper(
         return
 
     command_string = _helper_command_string(helper_script, project_dir)
-    platform_key = platform.system().lower()
+    platform_key = _PLATFORM_KEY
     terminal_command = settings.terminals.command_for(target_tool, platform_key)
     if not terminal_command:
         terminal_command = settings.terminals.defaults.get(platform_key)
     if terminal_command:
         formatted = [part.replace("{command}", command_string) for part in terminal_command]
-        subprocess.Popen(formatted, cwd=str(project_dir), env=os.environ.copy())
+        import subprocess
+
+        subprocess.Popen(formatted, cwd=str(project_dir))
         return
 
     if platform_key == "darwin":
@@ -416,28 +517,98 @@ def spawn_helper(
     _run_helper_direct(helper_script, project_dir)
 
 
-def launch_from_config(config: Mapping[str, object]) -> None:
+@dataclass(frozen=True)
+class LaunchConfig:
+    """Validated view of the helper configuration written by :func:`write_config`."""
+
+    command: tuple[str, ...]
+    cwd: str | None
+    env: dict[str, str]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> LaunchConfig:
+        """Coerce a decoded configuration payload into a :class:`LaunchConfig`.
+
+        Args:
+            data: Mapping produced by :func:`write_config` or a JSON decoder.
+
+        Returns:
+            LaunchConfig: Typed configuration with empty command parts and a
+            blank working directory dropped.
+
+        Raises:
+            ValueError: If ``command`` is present but not a list of arguments.
+        """
+        raw_command = data.get("command", ())
+        # A bare string would otherwise be split into one argument per character
+        if not isinstance(raw_command, list | tuple):
+            raise ValueError(f"command must be a list, not {type(raw_command).__name__}")
+        raw_env = data.get("env")
+        return cls(
+            command=tuple(part for part in map(str, raw_command) if part),
+            cwd=str(data.get("cwd", "")).strip() or None,
+            env=(
+                {str(key): str(value) for key, value in raw_env.items()}
+                if isinstance(raw_env, Mapping)
+                else {}
+            ),
+        )
+
+
+def load_launch_config(config_path: Path) -> LaunchConfig | None:
+    """Read and validate the helper configuration stored at ``config_path``.
+
+    Args:
+        config_path: JSON file produced by :func:`write_config`.
+
+    Returns:
+        LaunchConfig | None: Parsed configuration, or ``None`` after reporting
+        a missing or malformed file on ``stderr``.
+    """
+    try:
+        data = json.loads(config_path.read_bytes())
+    except FileNotFoundError:
+        sys.stderr.write(f"Missing config file {config_path.name}.\n")
+        return None
+    except (OSError, ValueError) as error:
+        sys.stderr.write(f"Unable to parse config file: {error}\n")
+        return None
+    if not isinstance(data, dict):
+        sys.stderr.write("Unable to parse config file: expected a JSON object\n")
+        return None
+    try:
+        return LaunchConfig.from_dict(data)
+    except ValueError as error:
+        sys.stderr.write(f"Unable to parse config file: {error}\n")
+        return None
+
+
+def launch_from_config(config: LaunchConfig | Mapping[str, object]) -> None:
     """Execute a continuation using a previously serialised configuration.
 
     Args:
-        config: Mapping produced by :func:`write_config`.
+        config: Configuration from :func:`load_launch_config`, or the raw
+            mapping produced by :func:`write_config`.
     """
-    command = [str(part) for part in config.get("command", []) if str(part)]
-    if not command:
+    if not isinstance(config, LaunchConfig):
+        try:
+            config = LaunchConfig.from_dict(config)
+        except ValueError as error:
+            sys.stderr.write(f"Invalid config: {error}\n")
+            return
+    if not config.command:
         sys.stderr.write("No command configured.\n")
         return
 
-    cwd_value = str(config.get("cwd", "")).strip()
-    cwd = cwd_value or None
-    env_payload = config.get("env", {})
-    env_updates = {
-        str(key): str(value) for key, value in getattr(env_payload, "items", lambda: [])()
-    }
-    environment = os.environ.copy()
-    environment.update(env_updates)
+    cwd = config.cwd
+    env_updates = config.env
+    # Inherit the parent environment untouched unless there is something to add
+    environment = {**os.environ, **env_updates} if env_updates else None
+
+    import subprocess
 
     try:
-        process = subprocess.Popen(command, cwd=cwd, env=environment)
+        process = subprocess.Popen(list(config.command), cwd=cwd, env=environment)
     except Exception as error:  # pragma: no cover - defensive guard
         sys.stderr.write(f"Failed to launch continuation: {error}\n")
         return
@@ -466,6 +637,8 @@ def _helper_command_string(helper_script: Path, project_dir: Path) -> str:
     Returns:
         str: Shell command string suitable for spawning in a terminal.
     """
+    import shlex
+
     python_exec = shlex.quote(sys.executable or "python3")
     script = shlex.quote(str(helper_script))
     directory = shlex.quote(str(project_dir))
@@ -479,11 +652,19 @@ def _run_helper_direct(helper_script: Path, project_dir: Path) -> None:
         helper_script: Path to the helper script.
         project_dir: Working directory for the helper run.
     """
+    import subprocess
+
     subprocess.run(
         [sys.executable or "python3", str(helper_script)], cwd=str(project_dir), check=False
     )
 
 
+# Terminals that run ``.command`` files passed to ``open -a`` without AppleScript
+_OPEN_COMMAND_APPS = frozenset({"Terminal", "Terminal.app", "iTerm", "iTerm.app"})
+# Backslashes and double quotes must be escaped inside AppleScript string literals
+_APPLESCRIPT_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
 def _escape_applescript(value: str) -> str:
     """Escape a command string for safe embedding inside AppleScript.
 
@@ -493,8 +674,7 @@ def _escape_applescript(value: str) -> str:
     Returns:
         str: Escaped string.
     """
-    escaped = value.replace("\\", "\\\\")
-    return escaped.replace('"', '"')
+    return value.translate(_APPLESCRIPT_ESCAPES)
 
 
 def _run_on_macos(
@@ -502,23 +682,65 @@ def _run_on_macos(
 ) -> None:
     """Request the macOS Terminal (or override) to run the helper command.
 
+    Terminal.app and iTerm open ``.command`` files natively, so they are
+    handed a throwaway script through ``open -a`` without starting
+    ``osascript``.  Other terminals are still driven through AppleScript.
+
     Args:
         helper_script: Helper script path used when falling back to direct run.
         project_dir: Directory the helper should operate in.
-        command: Command string passed to AppleScript.
+        command: Command string run by the terminal.
         terminal_env_key: Environment variable that may override the terminal.
     """
+    import subprocess
+
     terminal_app = os.environ.get(terminal_env_key) or "Terminal"
+    if terminal_app in _OPEN_COMMAND_APPS:
+        script = _write_command_script(command)
+        try:
+            subprocess.Popen(["open", "-a", terminal_app, str(script)])
+        except OSError:
+            # The script only deletes itself once a terminal runs it
+            script.unlink(missing_ok=True)
+            raise
+        return
     osa = f'tell application "{terminal_app}" to do script "{_escape_applescript(command)}"'
     subprocess.run(["osascript", "-e", osa], check=False)
 
 
+def _write_command_script(command: str) -> Path:
+    """Write ``command`` to a private, self-deleting ``.command`` script.
+
+    The command runs through ``$SHELL -lc`` so it sees the same login shell
+    and rc files as the ``do script`` AppleScript path.
+
+    Args:
+        command: Shell command the script should run.
+
+    Returns:
+        Path: Location of the executable script.
+    """
+    import shlex
+    import tempfile
+
+    body = f'#!/bin/sh\nrm -f -- "$0"\nexec "${{SHELL:-/bin/zsh}}" -lc {shlex.quote(command)}\n'
+    fd, name = tempfile.mkstemp(prefix="vomgr-", suffix=".command")
+    try:
+        os.write(fd, body.encode())
+        os.fchmod(fd, 0o700)
+    finally:
+        os.close(fd)
+    return Path(name)
+
+
 def _run_on_windows(command: str) -> None:
     """Launch a new Windows command prompt executing ``command``.
 
     Args:
         command: String executed within the spawned command prompt.
     """
+    import subprocess
+
     subprocess.Popen(["cmd.exe", "/c", "start", "", "cmd.exe", "/k", command])
 
 
@@ -533,9 +755,6 @@ def _emit_notification(env_updates: Mapping[str, str]) -> None:
     message = env_updates.get("VOMGR_NOTIFICATION_MESSAGE")
     if not message:
         return
-    sys.stdout.write(f"[vomgr] {message}\n")
+    # Message and bell go out in one write and one flush
+    sys.stdout.write(f"[vomgr] {message}\n\a")
     sys.stdout.flush()
-    try:
-        print("", end="", flush=True)
-    except Exception:  # pragma: no cover - console may reject bell
-        pass
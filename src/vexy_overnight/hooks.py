@@ -10,16 +10,116 @@ while uninstallation removes all generated artefacts.
 
 from __future__ import annotations
 
+import functools
 import importlib.resources as resources
+import os
+import string
 from pathlib import Path
 
-from loguru import logger
-
 TEMPLATE_PACKAGE = "vexy_overnight.hooks_tpl"
 TERMINAL_ENV_KEY = "VOMGR_TERMINAL_APP"
 FORCE_DIRECT_ENV_KEY = "VOMGR_HOOK_FORCE_DIRECT"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_template(template_name: str) -> tuple[tuple[str, str | None], ...]:
+    """Return a packaged hook template split into render segments, once per process.
+
+    Args:
+        template_name: Name of the file inside ``hooks_tpl``.
+
+    Returns:
+        tuple[tuple[str, str | None], ...]: ``(literal, field)`` pairs where
+        ``field`` names the context value following ``literal`` (``None`` for
+        the trailing literal).
+    """
+    source = resources.files(TEMPLATE_PACKAGE).joinpath(template_name).read_text(encoding="utf-8")
+    # Templates only use bare ``{name}`` placeholders, so spec and conversion are unused
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(source))
+
+
+def _render_template(template_name: str, context: dict[str, str]) -> str:
+    """Render a packaged template by joining its cached segments.
+
+    Args:
+        template_name: Name of the file inside ``hooks_tpl``.
+        context: Values substituted for the template placeholders.
+
+    Returns:
+        str: Rendered script source.
+
+    Raises:
+        KeyError: If ``context`` lacks a placeholder value.
+    """
+    parts: list[str] = []
+    for literal, field in _load_template(template_name):
+        parts.append(literal)
+        if field is not None:
+            parts.append(context[field])
+    return "".join(parts)
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` unless it is already a directory.
+
+    ``Path.mkdir(exist_ok=True)`` on an existing directory costs a failing
+    ``mkdir`` plus a ``stat``; checking first makes reinstalls one ``stat``.
+
+    Args:
+        path: Directory that must exist.
+    """
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+
+
+def _matches_installed(path: Path, payload: bytes) -> bool:
+    """Return whether ``path`` already holds ``payload`` with mode ``0o755``.
+
+    Args:
+        path: Installed script location.
+        payload: Freshly rendered script contents.
+
+    Returns:
+        bool: ``True`` when rewriting ``path`` would change nothing.
+    """
+    try:
+        stat = path.stat()
+        if stat.st_size != len(payload) or stat.st_mode & 0o777 != 0o755:
+            return False
+        return path.read_bytes() == payload
+    except OSError:
+        return False
+
+
+def _write_executable(path: Path, payload: bytes) -> None:
+    """Atomically replace ``path`` with ``payload`` as an executable script.
+
+    The data goes to a sibling temporary file created with mode ``0o755``
+    and is renamed over ``path``, so a hook firing mid-install never sees a
+    truncated script.
+
+    Args:
+        path: Script location to create or replace.
+        payload: Complete file contents.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+            if hasattr(os, "fchmod"):
+                # O_CREAT honours the umask; pin the exact mode like chmod did
+                os.fchmod(fd, 0o755)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class HookManager:
     """Install and remove continuation helper scripts for supported CLIs.
 
@@ -66,7 +166,7 @@ class HookManager:
 
     def _install_claude_hook(self) -> None:
         """Render and write Claude-specific hook and helper scripts."""
-        self.claude_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.claude_dir)
         context = dict(
             source_tool="claude",
             cli_executable="claude",
@@ -83,11 +183,13 @@ class HookManager:
             self.claude_helper_path,
             dict(config_filename=self.claude_config_name),
         )
+        from loguru import logger
+
         logger.debug("Installed Claude continuation hook at {}", self.claude_hook_path)
 
     def _install_codex_hook(self) -> None:
         """Render and write Codex hook and helper scripts."""
-        self.codex_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.codex_dir)
         context = dict(
             source_tool="codex",
             cli_executable="codex",
@@ -103,12 +205,16 @@ class HookManager:
             self.codex_helper_path,
             dict(config_filename=self.codex_config_name),
         )
+        from loguru import logger
+
         logger.debug("Installed Codex continuation hook at {}", self.codex_hook_path)
 
     def _install_gemini_hook(self) -> None:
         """Render the placeholder Gemini hook script."""
-        self.gemini_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.gemini_dir)
         self._write_template("voge_go.py", self.gemini_hook_path, {})
+        from loguru import logger
+
         logger.debug("Installed Gemini placeholder hook at {}", self.gemini_hook_path)
 
     def _write_template(
@@ -116,22 +222,25 @@ class HookManager:
     ) -> None:
         """Render a stored template and write the result to ``destination``.
 
+        An existing executable script with identical content is left untouched
+        so reinstalling does not churn modification times.
+
         Args:
             template_name: Name of the file inside ``hooks_tpl``.
             destination: Path where the rendered script should be stored.
-            context: Values interpolated into the template via ``str.format``.
+            context: Values substituted for the template placeholders.
 
         Raises:
             ValueError: If the provided context is missing required keys.
         """
-        template = resources.files(TEMPLATE_PACKAGE).joinpath(template_name)
-        content = template.read_text(encoding="utf-8")
         try:
-            rendered = content.format(**context)
+            rendered = _render_template(template_name, context)
         except KeyError as error:
             raise ValueError(f"Missing template context value: {error}") from error
-        destination.write_text(rendered, encoding="utf-8")
-        destination.chmod(0o755)
+        payload = rendered.encode("utf-8")
+        if _matches_installed(destination, payload):
+            return
+        _write_executable(destination, payload)
 
     @staticmethod
     def _remove_file(path: Path) -> None:
@@ -143,6 +252,8 @@ class HookManager:
         if not path.exists():
             return
         path.unlink()
+        from loguru import logger
+
         logger.debug("Removed hook artefact {}", path)
 
 
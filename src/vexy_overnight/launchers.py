@@ -3,6 +3,7 @@
 """Fire-facing launch helpers for Claude, Codex, and Gemini CLIs."""
 
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -34,9 +35,9 @@ class LauncherManager:
             str | None: Absolute path to the executable, or ``None`` if not
             found.
         """
-        result = subprocess.run(["which", cmd], capture_output=True, text=True)
-        if result.returncode == 0:
-            return result.stdout.strip()
+        resolved = shutil.which(cmd)
+        if resolved is not None:
+            return resolved
 
         # Check common locations
         common_paths = [
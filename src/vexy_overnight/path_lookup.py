@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# this_file: src/vexy_overnight/path_lookup.py
+"""Memoised executable lookups shared by the CLI and the hook runtime."""
+
+from __future__ import annotations
+
+import functools
+
+
+@functools.lru_cache(maxsize=32)
+def which(command_name: str, path_env: str | None) -> str | None:
+    """Resolve ``command_name`` against an explicit ``PATH`` value, memoised.
+
+    ``PATH`` is part of the cache key rather than read from the environment,
+    so a changed ``PATH`` triggers a fresh scan; call ``which.cache_clear()``
+    after installing a tool under an unchanged ``PATH``.
+
+    Args:
+        command_name: Command to resolve.
+        path_env: Value of ``PATH`` to search, normally ``os.environ.get("PATH")``.
+
+    Returns:
+        str | None: Absolute path when found, otherwise ``None``.
+    """
+    import shutil
+
+    return shutil.which(command_name, path=path_env)
+
+
+__all__ = ["which"]
@@ -3,6 +3,7 @@
 """Synchronise and edit shared instruction files across CLI tools."""
 
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -83,7 +84,7 @@ class RulesManager:
         return files_by_name
 
     def _command_exists(self, cmd: str) -> bool:
-        """Return whether ``cmd`` resolves via ``which``.
+        """Return whether ``cmd`` resolves via :func:`shutil.which`.
 
         Args:
             cmd: Command name to probe for availability.
@@ -91,8 +92,7 @@ class RulesManager:
         Returns:
             bool: ``True`` if the tool exists on the current ``PATH``.
         """
-        result = subprocess.run(["which", cmd], capture_output=True)
-        return result.returncode == 0
+        return shutil.which(cmd) is not None
 
     def sync_files(self):
         """Synchronise instruction files by linking them to a common parent."""
@@ -74,9 +74,8 @@ class SessionStateManager:
             return None
 
         try:
-            with open(self.state_file) as f:
-                data = json.load(f)
-                return SessionInfo.from_dict(data)
+            data = json.loads(self.state_file.read_bytes())
+            return SessionInfo.from_dict(data)
         except (json.JSONDecodeError, KeyError, ValueError):
             # Invalid or corrupted file
             return None
@@ -96,8 +95,7 @@ class SessionStateManager:
             tool=tool, pid=pid, start_time=datetime.now().isoformat(), cwd=cwd or os.getcwd()
         )
 
-        with open(self.state_file, "w") as f:
-            json.dump(session.to_dict(), f, indent=2)
+        self.state_file.write_text(json.dumps(session.to_dict(), indent=2))
 
         return session
 
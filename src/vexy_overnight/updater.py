@@ -2,6 +2,7 @@
 # this_file: src/vexy_overnight/updater.py
 """Update CLI toolchain dependencies used by the Vexy Overnight Manager."""
 
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -237,8 +238,7 @@ class UpdateManager:
             # Try uv first, then pip
             try:
                 # Check if uv is available
-                result = subprocess.run(["which", "uv"], capture_output=True)
-                if result.returncode == 0:
+                if shutil.which("uv") is not None:
                     result = subprocess.run(
                         ["uv", "pip", "install", "--upgrade", "vexy-overnight"],
                         capture_output=True,
@@ -4,17 +4,28 @@
 
 from __future__ import annotations
 
-import shutil
+import copy
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 
 import tomli
 import tomli_w
 
+from .file_signature import FileSignature, stat_signature
+
 SETTINGS_DIR_NAME = ".vexy-overnight"
 SETTINGS_FILE_NAME = "settings.toml"
-CONTINUATION_TOOLS = ("claude", "codex", "gemini")
+# Interned so validated tool names compare by identity in dict and set lookups
+CONTINUATION_TOOLS: tuple[str, ...] = tuple(
+    sys.intern(tool) for tool in ("claude", "codex", "gemini")
+)
+# Membership view of CONTINUATION_TOOLS for validation checks
+_CONTINUATION_TOOL_SET = frozenset(CONTINUATION_TOOLS)
+
+# Parsed settings payloads keyed by path, tagged with their file signature
+_PAYLOAD_CACHE: dict[Path, tuple[FileSignature, dict[str, object]]] = {}
 
 _DEFAULT_PROMPTS = {
     "claude": "Continue work in the next tool. Outstanding tasks:\n{todo}",
@@ -112,7 +123,7 @@ class UserSettings:
                 kill flag is not boolean.
         """
         for source, prefs in self.continuations.items():
-            if prefs.target not in CONTINUATION_TOOLS:
+            if prefs.target not in _CONTINUATION_TOOL_SET:
                 raise ValueError(f"unknown continuation target '{prefs.target}' for {source}")
         if not isinstance(self.kill_old_sessions, bool):
             raise ValueError("kill_old_sessions must be boolean")
@@ -213,13 +224,39 @@ def load_user_settings(home: Path | None = None) -> UserSettings:
         UserSettings: Persisted settings or freshly created defaults.
     """
     path = settings_path(home)
-    if not path.exists():
+    payload = _read_payload(path)
+    if payload is None:
         settings = UserSettings.default()
         save_user_settings(settings, home)
         return settings
-    with open(path, "rb") as handle:
-        payload = tomli.load(handle)
-    return UserSettings.from_dict(payload)
+    return UserSettings.from_dict(copy.deepcopy(payload))
+
+
+def _read_payload(path: Path) -> dict[str, object] | None:
+    """Return the parsed TOML payload at ``path``, reusing the cached parse.
+
+    The cache entry is tagged with the file's modification time, size and
+    inode, so edits made outside this process are picked up on the next call.
+    Callers must not mutate the returned mapping.
+
+    Args:
+        path: Settings file to read.
+
+    Returns:
+        dict[str, object] | None: Parsed payload, or ``None`` when the file
+        does not exist.
+    """
+    try:
+        signature = stat_signature(path)
+    except FileNotFoundError:
+        _PAYLOAD_CACHE.pop(path, None)
+        return None
+    cached = _PAYLOAD_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    payload = tomli.loads(path.read_bytes().decode("utf-8"))
+    _PAYLOAD_CACHE[path] = (signature, payload)
+    return payload
 
 
 def save_user_settings(settings: UserSettings, home: Path | None = None) -> Path:
@@ -234,10 +271,16 @@ def save_user_settings(settings: UserSettings, home: Path | None = None) -> Path
     """
     settings.validate()
     target = settings_path(home)
+    _PAYLOAD_CACHE.pop(target, None)
     target.parent.mkdir(parents=True, exist_ok=True)
     if target.exists():
-        backup = target.with_suffix(f"{target.suffix}.backup.{datetime.now():%Y%m%d_%H%M%S}")
+        import shutil
+
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        backup = target.with_suffix(f"{target.suffix}.backup.{stamp}")
         shutil.copy2(target, backup)
-    with open(target, "wb") as handle:
-        tomli_w.dump(settings.to_dict(), handle)
+    payload = settings.to_dict()
+    target.write_bytes(tomli_w.dumps(payload).encode("utf-8"))
+    # Seed the cache with what was just written so the next load skips parsing
+    _PAYLOAD_CACHE[target] = (stat_signature(target), copy.deepcopy(payload))
     return target
@@ -8,8 +8,6 @@ from copy import copy, deepcopy
 from dataclasses import dataclass
 from typing import Any, TypedDict
 
-from loguru import logger
-
 
 class Summary(TypedDict):
     """Structured representation of ``process_data`` results."""
@@ -76,6 +74,8 @@ def process_data(
         raise TypeError("config must be a Config instance")
 
     if debug:
+        from loguru import logger
+
         logger.debug("Debug mode enabled")
 
     if config and config.options is not None:
@@ -105,6 +105,8 @@ def process_data(
     }
 
     if debug:
+        from loguru import logger
+
         logger.debug("Summary generated: {}", summary)
 
     return summary
@@ -112,6 +114,8 @@ def process_data(
 
 def main() -> None:
     """Demonstrate :func:`process_data` by logging a simple summary."""
+    from loguru import logger
+
     sample = [1, 2, 3]
     config = Config(name="default", value="demo", options={"label": "sample"})
     summary = process_data(sample, config=config, debug=False)
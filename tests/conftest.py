@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# this_file: tests/conftest.py
+"""Shared fixtures for the vexy_overnight test suite."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def _modules_loaded_after(import_stmt: str) -> set[str]:
+    """Run ``import_stmt`` in a fresh interpreter and report ``sys.modules``.
+
+    Args:
+        import_stmt: Python statement executed before inspecting imports.
+
+    Returns:
+        set[str]: Names of every module loaded once the statement finished.
+    """
+    env = {**os.environ, "PYTHONPATH": f"{SRC_DIR}{os.pathsep}{os.environ.get('PYTHONPATH', '')}"}
+    script = f"import sys\n{import_stmt}\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env
+    )
+    return set(result.stdout.split())
+
+
+@pytest.fixture()
+def assert_not_imported_after() -> Callable[[str, set[str]], None]:
+    """Return a checker asserting an import leaves ``forbidden`` modules unloaded.
+
+    The import runs in a subprocess, so modules already loaded by the test
+    session cannot mask a regression.
+
+    Returns:
+        Callable[[str, set[str]], None]: ``check(import_stmt, forbidden)``.
+    """
+
+    def check(import_stmt: str, forbidden: set[str]) -> None:
+        loaded = _modules_loaded_after(import_stmt) & forbidden
+        assert not loaded, f"{import_stmt!r} should not import {sorted(loaded)}"
+
+    return check
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -12,7 +13,7 @@ import pytest
 from fire.core import FireError
 
 from vexy_overnight import __version__
-from vexy_overnight.cli import VomgrCLI
+from vexy_overnight.cli import VomgrCLI, _validate_tool
 from vexy_overnight.user_settings import UserSettings
 
 
@@ -125,6 +126,13 @@ def test_enable_gemini(cli_with_mocks):
     assert "not yet implemented" in message
 
 
+def test_disable_gemini_when_called_then_config_untouched(cli_with_mocks):
+    """Gemini disable returns the placeholder without touching configuration."""
+    message = cli_with_mocks.cli.disable("gemini")
+    assert "not yet implemented" in message
+    assert not cli_with_mocks.config.method_calls, "No config mutation expected for Gemini"
+
+
 def test_enable_invalid_tool(cli_with_mocks):
     """Unsupported tool names raise a :class:`FireError`."""
     with pytest.raises(FireError):
@@ -147,15 +155,18 @@ def test_disable_codex(cli_with_mocks):
 
 def test_status_command(cli_with_mocks):
     """Status command reports hook enablement and binary presence."""
-    cli_with_mocks.config.is_claude_hook_enabled.return_value = True
-    cli_with_mocks.config.is_codex_hook_enabled.return_value = False
-    cli_with_mocks.config.is_tool_installed.side_effect = lambda tool: tool != "codex"
+    cli_with_mocks.config.status_snapshot.return_value = {
+        "claude": {"hook_enabled": True, "installed": True},
+        "codex": {"hook_enabled": False, "installed": False},
+        "gemini": {"hook_enabled": False, "installed": True},
+    }
 
     status = cli_with_mocks.cli.status()
 
-    assert "Claude: enabled" in status
-    assert "Codex: disabled" in status
-    assert "Gemini" in status
+    assert "Claude: enabled (installed=True)" in status
+    assert "Codex: disabled (installed=False)" in status
+    assert "Gemini installed=True" in status
+    cli_with_mocks.config.status_snapshot.assert_called_once_with()
 
 
 def test_run_claude(cli_with_mocks):
@@ -174,6 +185,12 @@ def test_run_codex(cli_with_mocks):
     )
 
 
+def test_run_when_cwd_given_then_launcher_receives_path(cli_with_mocks, tmp_path):
+    """The ``cwd`` argument is converted to a :class:`Path` before launching."""
+    cli_with_mocks.cli.run("gemini", cwd=str(tmp_path))
+    cli_with_mocks.launcher.launch_gemini.assert_called_once_with(cwd=tmp_path, prompt=None)
+
+
 def test_run_invalid_tool(cli_with_mocks):
     """Unknown tools cause Fire to raise a :class:`FireError`."""
     with pytest.raises(FireError):
@@ -202,6 +219,18 @@ def test_rules_search(cli_with_mocks):
     cli_with_mocks.rules.search_files.assert_called_with("pattern")
 
 
+def test_rules_search_when_no_results_then_reports_no_matches(cli_with_mocks):
+    """Empty search results produce a single explanatory line."""
+    cli_with_mocks.rules.search_files.return_value = {}
+    assert cli_with_mocks.cli.rules(search="pattern") == "No matches found"
+
+
+def test_update_check_when_no_versions_then_reports_unavailable(cli_with_mocks):
+    """Empty version data produces a single explanatory line."""
+    cli_with_mocks.update.check_versions.return_value = {}
+    assert cli_with_mocks.cli.update(check=True) == "No version information available"
+
+
 def test_update_check(cli_with_mocks):
     """Update command with ``check`` prints version comparisons."""
     cli_with_mocks.update.check_versions.return_value = {
@@ -250,6 +279,14 @@ def test_notify_sound_updates_sound(cli_with_mocks):
     assert cli_with_mocks.settings.notifications.sound == "ding"
 
 
+def test_terminal_set_when_mixed_case_platform_then_stored_lower_case(cli_with_mocks):
+    """Terminal platform keys are normalised to lower case before storage."""
+    message = cli_with_mocks.cli.terminal.set("Darwin", "open", "{command}")
+
+    assert message == "Terminal command for darwin updated"
+    assert cli_with_mocks.cli.terminal.show("darwin") == ["open", "{command}"]
+
+
 def test_terminal_set_updates_command(cli_with_mocks):
     """Terminal.set records the terminal command for the given platform."""
     message = cli_with_mocks.cli.terminal.set("darwin", "open", "-a", "Alacritty", "{command}")
@@ -260,3 +297,119 @@ def test_terminal_set_updates_command(cli_with_mocks):
 def test_version_returns_package_version(cli_with_mocks):
     """Version command surfaces the package's ``__version__`` string."""
     assert cli_with_mocks.cli.version() == __version__
+
+
+def test_default_factories_when_invoked_then_build_real_managers():
+    """Default factories import their manager modules lazily and build instances."""
+    from vexy_overnight.config import ConfigManager
+    from vexy_overnight.rules import RulesManager
+
+    cli = VomgrCLI()
+
+    assert isinstance(cli._config_factory(), ConfigManager)
+    rules_mgr = cli._rules_factory(global_mode=True)
+    assert isinstance(rules_mgr, RulesManager)
+    assert rules_mgr.global_mode is True
+
+
+def test_factories_when_commands_repeated_then_collaborators_built_once():
+    """Repeated commands on one CLI reuse the managers built by its factories."""
+    built = []
+
+    def config_factory() -> MagicMock:
+        built.append("config")
+        return MagicMock()
+
+    def rules_factory(global_mode: bool = False) -> MagicMock:
+        built.append(f"rules:{global_mode}")
+        return MagicMock()
+
+    cli = VomgrCLI(config_factory=config_factory, rules_factory=rules_factory)
+    cli.enable("claude")
+    cli.disable("codex")
+    cli.rules(sync=True)
+    cli.rules(sync=True)
+    cli.rules(sync=True, global_mode=True)
+
+    assert built == ["config", "rules:False", "rules:True"], "Factories should be memoised"
+
+
+def test_settings_namespace_when_called_repeatedly_then_loads_once():
+    """Sub-CLI commands reuse one settings snapshot instead of reloading it."""
+    settings = UserSettings.default()
+    loads = []
+
+    def loader() -> UserSettings:
+        loads.append(1)
+        return settings
+
+    cli = VomgrCLI(settings_loader=loader, settings_saver=lambda updated: Path("/tmp/s.toml"))
+
+    cli.continuation.status()
+    cli.continuation.set("claude", "gemini")
+    cli.prompt.set("claude", "Next {todo}")
+    status = cli.continuation.status()
+
+    assert len(loads) == 1, "Settings should be loaded once across all namespaces"
+    assert status["claude"]["target"] == "gemini", "Saved changes must stay visible"
+    assert cli.prompt.show("claude") == "Next {todo}", "Namespaces must share one snapshot"
+
+
+def test_settings_namespace_when_save_fails_then_reloads_from_loader():
+    """A failed save drops the cached snapshot so the next read hits storage."""
+    loads = []
+
+    def loader() -> UserSettings:
+        loads.append(1)
+        return UserSettings.default()
+
+    def failing_saver(updated: UserSettings) -> Path:
+        raise ValueError("invalid settings")
+
+    cli = VomgrCLI(settings_loader=loader, settings_saver=failing_saver)
+
+    with pytest.raises(ValueError):
+        cli.prompt.set("claude", "Broken {todo}")
+    prompt = cli.prompt.show("claude")
+
+    assert len(loads) == 2, "Failed save must invalidate the cached snapshot"
+    assert prompt != "Broken {todo}", "Unsaved mutation must not leak into later reads"
+
+
+def test_validate_tool_when_repeated_then_cached_and_invalid_always_raises():
+    """Valid tool names are memoised while invalid names keep raising."""
+    _validate_tool.cache_clear()
+
+    assert _validate_tool("Claude") == "claude"
+    assert _validate_tool("Claude") == "claude"
+    assert _validate_tool.cache_info().hits == 1, "Second lookup should hit the cache"
+    assert _validate_tool("CODEX") is _validate_tool("codex"), "Tool keys should be interned"
+
+    for _ in range(2):
+        with pytest.raises(FireError):
+            _validate_tool("invalid")
+
+
+def test_cli_import_when_module_loaded_then_fire_and_managers_deferred(
+    assert_not_imported_after: Callable[[str, set[str]], None],
+):
+    """Importing the CLI module must not load Fire or any manager module."""
+    managers = ("config", "hooks", "launchers", "rules", "updater")
+    assert_not_imported_after(
+        "import vexy_overnight.cli", {"fire"} | {f"vexy_overnight.{name}" for name in managers}
+    )
+
+
+@pytest.mark.parametrize("flag", ["version", "--version", "-V"])
+def test_main_when_version_requested_then_printed_without_fire(flag, monkeypatch, capsys):
+    """Version requests short-circuit before Fire is imported."""
+    import sys
+
+    from vexy_overnight.cli import main
+
+    monkeypatch.setattr(sys, "argv", ["vomgr", flag])
+    monkeypatch.setitem(sys.modules, "fire", None)  # any import attempt would fail
+
+    main()
+
+    assert capsys.readouterr().out.strip() == __version__
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -80,7 +81,7 @@ def test_enable_claude_hook_when_write_fails_then_original_restored(
     def boom(*args, **kwargs):  # type: ignore[no-untyped-def]
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(json, "dump", boom)
+    monkeypatch.setattr("vexy_overnight.config._json_dumps", boom)
 
     with pytest.raises(RuntimeError):
         manager.enable_claude_hook()
@@ -100,10 +101,10 @@ def test_enable_claude_hook_when_validation_fails_then_original_restored(
 
     manager = ConfigManager()
 
-    def fail_validation(self: ConfigManager, path: Path) -> None:  # noqa: ARG001
+    def fail_validation(self: ConfigManager, payload: bytes) -> None:  # noqa: ARG001
         raise ValueError("invalid")
 
-    monkeypatch.setattr(ConfigManager, "_validate_json_file", fail_validation, raising=False)
+    monkeypatch.setattr(ConfigManager, "_validate_json_payload", fail_validation)
 
     with pytest.raises(ValueError):
         manager.enable_claude_hook()
@@ -168,7 +169,7 @@ def test_enable_codex_hook_when_write_fails_then_original_restored(
 
     import tomli_w
 
-    monkeypatch.setattr(tomli_w, "dump", boom)
+    monkeypatch.setattr(tomli_w, "dumps", boom)
 
     with pytest.raises(RuntimeError):
         manager.enable_codex_hook()
@@ -187,10 +188,10 @@ def test_enable_codex_hook_when_validation_fails_then_original_restored(
 
     manager = ConfigManager()
 
-    def fail_validation(self: ConfigManager, path: Path) -> None:  # noqa: ARG001
+    def fail_validation(self: ConfigManager, payload: bytes) -> None:  # noqa: ARG001
         raise ValueError("invalid")
 
-    monkeypatch.setattr(ConfigManager, "_validate_toml_file", fail_validation, raising=False)
+    monkeypatch.setattr(ConfigManager, "_validate_toml_payload", fail_validation)
 
     with pytest.raises(ValueError):
         manager.enable_codex_hook()
@@ -198,6 +199,9 @@ def test_enable_codex_hook_when_validation_fails_then_original_restored(
     assert _read_toml(config_path) == {"profile": "gpt4"}, (
         "Codex config must roll back when validation fails"
     )
+    assert not list(config_path.parent.glob("config.toml.backup.*")), (
+        "Rejected payloads should not leave a backup behind"
+    )
 
 
 def test_enable_codex_hook_when_called_then_sets_notify(fake_home: Path) -> None:
@@ -236,3 +240,384 @@ def test_enable_codex_hook_when_existing_config_then_creates_backup(fake_home: P
 
     backups = list(config_path.parent.glob("config.toml.backup.*"))
     assert backups, "Enabling Codex hook must produce a backup before editing"
+
+
+def test_backup_config_when_debug_logging_then_paths_interpolated(fake_home: Path) -> None:
+    """The backup debug record names both files instead of raw placeholders."""
+    from loguru import logger
+
+    config_path = fake_home / ".codex" / "config.toml"
+    _write_toml(config_path, "profile = 'gpt4'")
+    messages: list[str] = []
+    sink_id = logger.add(messages.append, level="DEBUG", format="{message}")
+    try:
+        backup = ConfigManager().backup_config(config_path)
+    finally:
+        logger.remove(sink_id)
+
+    assert f"Backed up {config_path} to {backup}\n" in messages, "Paths should be formatted"
+
+
+def test_status_snapshot_when_hooks_enabled_then_reports_all_tools(
+    fake_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Status snapshot should combine hook state and PATH lookups per tool."""
+    manager = ConfigManager()
+    manager.enable_claude_hook()
+    monkeypatch.setattr(
+        "vexy_overnight.config.shutil.which",
+        lambda tool, path=None: f"/usr/bin/{tool}" if tool != "codex" else None,
+    )
+    ConfigManager.clear_caches()
+
+    snapshot = manager.status_snapshot()
+
+    assert snapshot == {
+        "claude": {"hook_enabled": True, "installed": True},
+        "codex": {"hook_enabled": False, "installed": False},
+        "gemini": {"hook_enabled": False, "installed": True},
+    }, "Snapshot must report hook and install state for every tool"
+
+
+def test_is_tool_installed_when_repeated_then_path_scanned_once(
+    fake_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """PATH lookups are memoised until PATH changes or caches are cleared."""
+    calls: list[tuple[str, str | None]] = []
+
+    def fake_which(tool: str, path: str | None = None) -> str | None:
+        calls.append((tool, path))
+        return None
+
+    monkeypatch.setattr("vexy_overnight.config.shutil.which", fake_which)
+    monkeypatch.setenv("PATH", "/first")
+    ConfigManager.clear_caches()
+    manager = ConfigManager()
+
+    assert manager.is_tool_installed("claude") is False
+    assert manager.is_tool_installed("claude") is False
+    assert calls == [("claude", "/first")], "Repeated lookups should hit the cache"
+
+    monkeypatch.setenv("PATH", "/second")
+    manager.is_tool_installed("claude")
+    ConfigManager.clear_caches()
+    manager.is_tool_installed("claude")
+    assert calls[1:] == [("claude", "/second")] * 2, "PATH change or clear must rescan"
+
+
+def test_clear_caches_when_called_then_parsed_configs_dropped(fake_home: Path) -> None:
+    """Clearing caches forces the next read to parse the config again."""
+    from vexy_overnight import config as config_module
+
+    manager = ConfigManager()
+    manager.enable_claude_hook()
+    assert manager.is_claude_hook_enabled() is True
+    assert manager.claude_config in config_module._CONFIG_CACHE, "Read should populate cache"
+
+    ConfigManager.clear_caches()
+
+    assert config_module._CONFIG_CACHE == {}, "Parsed configs must be forgotten"
+
+
+def test_is_claude_hook_enabled_when_file_unchanged_then_parse_reused(
+    fake_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unchanged settings are parsed once and re-parsed after a rewrite."""
+    import vexy_overnight.config as config_module
+
+    settings_path = fake_home / ".claude" / "settings.json"
+    _write_json(settings_path, {"hooks": {}, "note": "vocl-go is not wired up yet"})
+    parses: list[bytes] = []
+    real_loads = config_module._json_loads
+
+    def counting_loads(data: bytes) -> object:
+        parses.append(data)
+        return real_loads(data)
+
+    monkeypatch.setattr(config_module, "_json_loads", counting_loads)
+    manager = ConfigManager()
+
+    assert manager.is_claude_hook_enabled() is False
+    assert manager.is_claude_hook_enabled() is False
+    assert len(parses) == 1, "Unchanged file should be served from the cache"
+
+    manager.enable_claude_hook()
+    assert manager.is_claude_hook_enabled() is True, "Writes must invalidate the cached parse"
+
+
+@pytest.mark.parametrize(
+    ("relative", "content", "check"),
+    [
+        (".claude/settings.json", '{"hooks": "vocl-go', "is_claude_hook_enabled"),
+        (".codex/config.toml", 'notify = ["voco-go"', "is_codex_hook_enabled"),
+    ],
+)
+def test_is_hook_enabled_when_config_malformed_then_false(
+    fake_home: Path, relative: str, content: str, check: str
+) -> None:
+    """Unparseable configs report the hook as disabled instead of raising."""
+    config_path = fake_home / relative
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(content)
+
+    assert getattr(ConfigManager(), check)() is False, "Decode errors should read as disabled"
+
+
+@pytest.mark.parametrize(
+    ("relative", "content", "check"),
+    [
+        (".claude/settings.json", '["vocl-go"]', "is_claude_hook_enabled"),
+        (".claude/settings.json", '{"hooks": ["vocl-go"]}', "is_claude_hook_enabled"),
+        (".claude/settings.json", '{"hooks": {"Stop": ["vocl-go"]}}', "is_claude_hook_enabled"),
+        (
+            ".claude/settings.json",
+            '{"hooks": {"Stop": [{"hooks": [{"command": ["vocl-go"]}]}]}}',
+            "is_claude_hook_enabled",
+        ),
+        (".codex/config.toml", 'notify = "voco-go"', "is_codex_hook_enabled"),
+        (
+            ".codex/config.toml",
+            'notify = [1, 2]\nx = "voco-go"',
+            "is_codex_hook_enabled",
+        ),
+    ],
+)
+def test_is_hook_enabled_when_config_shape_unexpected_then_false(
+    fake_home: Path, relative: str, content: str, check: str
+) -> None:
+    """Well-formed configs with unexpected value types read as disabled, not crash."""
+    config_path = fake_home / relative
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(content)
+
+    assert getattr(ConfigManager(), check)() is False, "Unexpected shapes should read as disabled"
+
+
+def test_load_json_when_result_mutated_then_cache_unaffected(fake_home: Path) -> None:
+    """Mutating a loaded document must not leak into later loads."""
+    settings_path = fake_home / ".claude" / "settings.json"
+    _write_json(settings_path, {"hooks": {"Stop": []}})
+    manager = ConfigManager()
+
+    manager._load_json(settings_path)["hooks"]["Stop"].append("mutated")
+
+    assert manager._load_json(settings_path) == {"hooks": {"Stop": []}}
+
+
+def test_disable_hooks_when_configs_missing_then_nothing_created(fake_home: Path) -> None:
+    """Disabling hooks without config files must not create or back up files."""
+    manager = ConfigManager()
+
+    manager.disable_claude_hook()
+    manager.disable_codex_hook()
+
+    assert manager.backup_config(manager.claude_config) is None, "Missing files have no backup"
+    assert not manager.claude_config.exists(), "Claude settings must not be created"
+    assert not manager.codex_config.exists(), "Codex config must not be created"
+
+
+def test_enable_claude_hook_when_stale_temp_file_then_replaced_and_removed(
+    fake_home: Path,
+) -> None:
+    """A leftover temp file from a crashed write must not leak into the result."""
+    settings_path = fake_home / ".claude" / "settings.json"
+    tmp_path = settings_path.with_suffix(".json.tmp")
+    _write_json(tmp_path, {"stale": True})
+
+    ConfigManager().enable_claude_hook()
+
+    assert "stale" not in _read_json(settings_path), "Stale temp content must be overwritten"
+    assert not tmp_path.exists(), "Temp file should be consumed by the atomic replace"
+
+
+def test_is_codex_hook_enabled_when_helper_never_mentioned_then_parse_skipped(
+    fake_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files that never mention the helper are rejected without parsing."""
+    import vexy_overnight.config as config_module
+
+    _write_toml(fake_home / ".codex" / "config.toml", "notify = ['other-tool']")
+
+    def fail_parse(data: bytes) -> dict:
+        raise AssertionError("parser should not run for a negative byte scan")
+
+    monkeypatch.setattr(config_module, "_toml_loads", fail_parse)
+
+    assert ConfigManager().is_codex_hook_enabled() is False
+
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_fast_copy_when_called_then_content_mode_and_mtime_preserved(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, kernel_copy: bool
+) -> None:
+    """Backups keep the source bytes, permission bits and modification time."""
+    import errno
+    import os
+
+    from vexy_overnight.config import _fast_copy
+
+    if not kernel_copy and hasattr(os, "copy_file_range"):
+
+        def unsupported(*args: object) -> int:
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(os, "copy_file_range", unsupported)
+
+    src = tmp_path / "settings.json"
+    src.write_text('{"hooks": {}}')
+    src.chmod(0o640)
+    os.utime(src, ns=(1_000_000_000, 2_000_000_000))
+    dst = tmp_path / "settings.json.backup"
+
+    _fast_copy(src, dst)
+
+    assert dst.read_text() == '{"hooks": {}}', "Backup content must match the source"
+    assert dst.stat().st_mode & 0o777 == 0o640, "Backup must keep permission bits"
+    assert dst.stat().st_mtime_ns == 2_000_000_000, "Backup must keep the source mtime"
+
+
+def test_migrate_from_legacy_when_old_hooks_present_then_rewritten(fake_home: Path) -> None:
+    """Legacy claude4ever/codex4ever hooks are pointed at the new helpers."""
+    settings_path = fake_home / ".claude" / "settings.json"
+    legacy_stop = [{"hooks": [{"type": "command", "command": "python claude4ever.py"}]}]
+    _write_json(settings_path, {"hooks": {"Stop": legacy_stop}})
+    config_path = fake_home / ".codex" / "config.toml"
+    _write_toml(config_path, "notify = ['codex4ever.py', 'other']")
+
+    manager = ConfigManager()
+    manager.migrate_from_legacy()
+
+    command = _read_json(settings_path)["hooks"]["Stop"][0]["hooks"][0]["command"]
+    assert command == f'"{manager.claude_hook_path}" "$CLAUDE_PROJECT_DIR"'
+    assert _read_toml(config_path)["notify"] == [str(manager.codex_hook_path), "other"]
+
+
+def test_migrate_from_legacy_when_no_legacy_claude_hook_then_settings_untouched(
+    fake_home: Path,
+) -> None:
+    """Settings without claude4ever hooks are neither backed up nor rewritten."""
+    settings_path = fake_home / ".claude" / "settings.json"
+    settings_path.parent.mkdir(parents=True)
+    settings_path.write_text('{"theme": "dark"}')
+    before = settings_path.stat().st_mtime_ns
+
+    ConfigManager().migrate_from_legacy()
+
+    assert settings_path.stat().st_mtime_ns == before, "Unrelated settings must not be rewritten"
+    assert not list(settings_path.parent.glob("settings.json.backup.*")), "No backup expected"
+
+
+def test_enable_claude_hook_when_orjson_unavailable_then_stdlib_json_used(
+    fake_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Without orjson the stdlib writes two-space indented JSON."""
+    import vexy_overnight.config as config_module
+
+    monkeypatch.setattr(config_module, "orjson", None)
+    manager = ConfigManager()
+    manager.enable_claude_hook()
+
+    written = manager.claude_config.read_text()
+    assert written == json.dumps(_read_json(manager.claude_config), indent=2), (
+        "Fallback output must be two-space indented JSON"
+    )
+    assert manager.is_claude_hook_enabled() is True, "Fallback parser must read the hook back"
+
+
+def test_json_dumps_when_orjson_rejects_value_then_stdlib_fallback() -> None:
+    """Integers beyond 64 bits and non-ASCII text survive the orjson path."""
+    import vexy_overnight.config as config_module
+
+    data = {"big": 2**70, "name": "Zoë"}
+
+    payload = config_module._json_dumps(data)
+
+    assert json.loads(payload) == data, "Oversized integers must round-trip"
+    assert "Zoë".encode() in payload, "Non-ASCII text is written as raw UTF-8"
+
+
+def test_enable_codex_hook_when_config_cached_then_cache_not_mutated(fake_home: Path) -> None:
+    """Top-level edits on the shallow TOML copy must not leak into the cache."""
+    config_path = fake_home / ".codex" / "config.toml"
+    _write_toml(config_path, "notify = ['voco-go-old']\n[profiles.fast]\nmodel = 'x'\n")
+    manager = ConfigManager()
+    assert manager.is_codex_hook_enabled() is True  # populates the shared cache
+
+    config = manager._load_toml(config_path)
+    config["notify"] = []
+
+    assert manager._load_toml(config_path)["notify"] == ["voco-go-old"]
+
+
+def test_fast_copy_when_reflink_succeeds_then_no_byte_copy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A successful reflink clone skips the copy_file_range loop."""
+    import os
+
+    import vexy_overnight.config as config_module
+
+    clones: list[tuple[int, int]] = []
+
+    class FakeFcntl:
+        @staticmethod
+        def ioctl(dst_fd: int, request: int, src_fd: int) -> int:
+            assert request == config_module._FICLONE
+            clones.append((dst_fd, src_fd))
+            os.write(dst_fd, os.pread(src_fd, 1024, 0))
+            return 0
+
+    def no_copy(*args: object) -> int:
+        raise AssertionError("copy_file_range must not run after a clone")
+
+    monkeypatch.setattr(config_module, "fcntl", FakeFcntl)
+    monkeypatch.setattr(config_module.sys, "platform", "linux")
+    monkeypatch.setattr(os, "copy_file_range", no_copy, raising=False)
+    src = tmp_path / "config.toml"
+    src.write_text("notify = []\n")
+    dst = tmp_path / "config.toml.backup"
+
+    config_module._fast_copy(src, dst)
+
+    assert len(clones) == 1, "Reflink should be attempted exactly once"
+    assert dst.read_text() == "notify = []\n"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_enable_hooks_when_configs_rewritten_then_permissions_preserved(fake_home: Path) -> None:
+    """Rewrites keep an existing file's mode; new files follow the umask."""
+    manager = ConfigManager()
+    _write_json(manager.claude_config, {})
+    manager.claude_config.chmod(0o640)
+
+    old_umask = os.umask(0o022)
+    try:
+        manager.enable_claude_hook()
+        manager.enable_codex_hook()
+    finally:
+        os.umask(old_umask)
+
+    assert manager.claude_config.stat().st_mode & 0o777 == 0o640, "Existing mode must be kept"
+    assert manager.codex_config.stat().st_mode & 0o777 == 0o644, "New files follow the umask"
+
+
+def test_migrate_from_legacy_when_legacy_hooks_rewritten_then_single_backup_each(
+    fake_home: Path,
+) -> None:
+    """Each migrated file gets one backup, and a rerun changes nothing."""
+    settings_path = fake_home / ".claude" / "settings.json"
+    legacy_stop = [{"hooks": [{"type": "command", "command": "claude4ever.py"}]}]
+    _write_json(settings_path, {"hooks": {"Stop": legacy_stop}})
+    config_path = fake_home / ".codex" / "config.toml"
+    _write_toml(config_path, "notify = ['codex4ever.py']")
+    manager = ConfigManager()
+
+    manager.migrate_from_legacy()
+    migrated = (settings_path.read_bytes(), config_path.read_bytes())
+    manager.migrate_from_legacy()
+
+    assert len(list(settings_path.parent.glob("settings.json.backup.*"))) == 1
+    assert len(list(config_path.parent.glob("config.toml.backup.*"))) == 1
+    assert (settings_path.read_bytes(), config_path.read_bytes()) == migrated, (
+        "A second migration must be a no-op"
+    )
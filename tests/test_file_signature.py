@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# this_file: tests/test_file_signature.py
+"""Tests for the file-version signature shared by the parse caches."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from vexy_overnight.file_signature import stat_signature
+
+
+def test_stat_signature_when_file_replaced_in_same_tick_then_signature_differs(
+    tmp_path: Path,
+) -> None:
+    """Same mtime and size still differ once another inode is swapped in."""
+    target = tmp_path / "settings.toml"
+    target.write_text("a = 1\n")
+    before = stat_signature(target)
+    stat = target.stat()
+
+    replacement = tmp_path / "settings.toml.new"
+    replacement.write_text("a = 2\n")
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    keep_inode_alive = tmp_path / "settings.toml.old"
+    os.link(target, keep_inode_alive)
+    os.replace(replacement, target)
+
+    after = stat_signature(target)
+    assert before[:2] == after[:2], "Fixture should keep mtime and size identical"
+    assert before != after, "The inode must distinguish the replaced file"
+
+
+def test_stat_signature_when_file_missing_then_file_not_found(tmp_path: Path) -> None:
+    """Missing files raise so callers can drop their cache entry."""
+    with pytest.raises(FileNotFoundError):
+        stat_signature(tmp_path / "missing.toml")
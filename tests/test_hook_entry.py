@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# this_file: tests/test_hook_entry.py
+"""Tests for the shared hook entry point used by installed hook scripts."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from vexy_overnight.hook_entry import (
+    HookSpec,
+    _latest_session_directory,
+    _session_cwd,
+    determine_project_dir,
+    read_payload,
+)
+
+CLAUDE_SPEC = HookSpec(
+    source_tool="claude",
+    helper_name="vocl-new.py",
+    config_filename="vocl-new.json",
+    terminal_env_key="VOMGR_TERMINAL",
+    force_direct_env_key="VOMGR_FORCE_DIRECT",
+    env_project_key="CLAUDE_PROJECT_DIR",
+)
+CODEX_SPEC = HookSpec(
+    source_tool="codex",
+    helper_name="voco-new.py",
+    config_filename="voco-new.json",
+    terminal_env_key="VOMGR_TERMINAL",
+    force_direct_env_key="VOMGR_FORCE_DIRECT",
+    sessions_relative=".codex/sessions",
+)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("", {}), ("not json", {}), ("[1, 2]", {}), ('{"cwd": "/x"}', {"cwd": "/x"})],
+)
+def test_read_payload_when_stdin_varies_then_returns_mapping(
+    monkeypatch: pytest.MonkeyPatch, raw: str, expected: dict[str, str]
+) -> None:
+    """Only JSON objects are returned; anything else yields an empty payload."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(raw))
+
+    assert read_payload() == expected
+
+
+def test_determine_project_dir_when_claude_env_set_then_env_wins(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The Claude project variable takes precedence over the payload."""
+    env_dir = tmp_path / "env"
+    payload_dir = tmp_path / "payload"
+    env_dir.mkdir()
+    payload_dir.mkdir()
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(env_dir))
+
+    assert determine_project_dir(CLAUDE_SPEC, {"cwd": str(payload_dir)}) == env_dir
+
+    monkeypatch.delenv("CLAUDE_PROJECT_DIR")
+    assert determine_project_dir(CLAUDE_SPEC, {"cwd": str(payload_dir)}) == payload_dir
+
+
+def test_determine_project_dir_when_codex_context_string_then_context_used(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Codex JSON context strings are decoded before falling back to the payload."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    payload = {"context": json.dumps({"cwd": str(project_dir)}), "cwd": str(tmp_path)}
+
+    assert determine_project_dir(CODEX_SPEC, payload) == project_dir
+
+
+def test_latest_session_directory_when_session_log_large_then_cwd_found_from_matching_line(
+    tmp_path: Path,
+) -> None:
+    """Only records mentioning ``cwd`` are decoded when scanning session logs."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    sessions = tmp_path / "sessions"
+    sessions.mkdir()
+    records = [
+        "not json at all",
+        json.dumps({"type": "note", "text": "mentions cwd only in prose"}),
+        json.dumps({"cwd": str(tmp_path / "deleted")}),
+        json.dumps({"cwd": str(project_dir)}),
+    ]
+    (sessions / "rollout.jsonl").write_text("\n".join(records))
+
+    assert _latest_session_directory(sessions) == project_dir, (
+        "The first record with an existing cwd should win"
+    )
+    assert _session_cwd(b'["cwd"]\n{"cwd": 1}') is None, "Non-path records are skipped"
+
+
+def test_latest_session_directory_when_newest_lacks_cwd_then_older_sessions_checked(
+    tmp_path: Path,
+) -> None:
+    """The newest log is tried first, falling back to older logs by recency."""
+    sessions = tmp_path / "sessions"
+    assert _latest_session_directory(sessions) is None, "Missing sessions dir yields None"
+
+    sessions.mkdir()
+    old_dir = tmp_path / "old"
+    mid_dir = tmp_path / "mid"
+    old_dir.mkdir()
+    mid_dir.mkdir()
+    for name, cwd, mtime in [
+        ("a.jsonl", old_dir, 100),
+        ("b.jsonl", mid_dir, 200),
+        ("c.jsonl", None, 300),
+    ]:
+        stream = sessions / name
+        stream.write_text(json.dumps({"cwd": str(cwd)} if cwd else {"type": "start"}))
+        os.utime(stream, (mtime, mtime))
+    (sessions / "notes.txt").write_text(json.dumps({"cwd": str(old_dir)}))
+
+    assert _latest_session_directory(sessions) == mid_dir, (
+        "The most recent log with a usable cwd should be chosen"
+    )
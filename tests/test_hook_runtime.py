@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+# this_file: tests/test_hook_runtime.py
+"""Tests for the runtime helpers shared by continuation hook scripts."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import vexy_overnight.hook_runtime as hook_runtime
+from vexy_overnight.path_lookup import which
+
+
+@pytest.fixture(autouse=True)
+def clear_runtime_caches() -> None:
+    """Start every test with empty file caches."""
+    hook_runtime._todo_lines_cached.cache_clear()
+    hook_runtime._plan_hint_cached.cache_clear()
+    which.cache_clear()
+    hook_runtime._compile_template.cache_clear()
+
+
+def test_collect_todo_lines_when_many_items_then_first_five_unchecked(tmp_path: Path) -> None:
+    """Only the first five unchecked entries are returned, stripped."""
+    items = [f"  - [ ] task {index}" for index in range(8)]
+    (tmp_path / "TODO.md").write_text("- [x] done\n" + "\n".join(items) + "\n")
+
+    assert hook_runtime._collect_todo_lines(tmp_path) == [
+        f"- [ ] task {index}" for index in range(5)
+    ], "Unchecked lines should be stripped and capped at five"
+
+
+def test_collect_todo_lines_when_file_missing_then_empty(tmp_path: Path) -> None:
+    """Projects without a TODO.md contribute no lines."""
+    assert hook_runtime._collect_todo_lines(tmp_path) == []
+
+
+def test_collect_todo_lines_when_file_unchanged_then_read_once(tmp_path: Path) -> None:
+    """Unchanged TODO files are served from the cache until they are rewritten."""
+    todo_path = tmp_path / "TODO.md"
+    todo_path.write_text("- [ ] first\n")
+    cache = hook_runtime._todo_lines_cached
+
+    first = hook_runtime._collect_todo_lines(tmp_path)
+    first.append("- [ ] caller mutation")
+    assert hook_runtime._collect_todo_lines(tmp_path) == ["- [ ] first"], (
+        "Cached lines must not be affected by caller mutation"
+    )
+    assert cache.cache_info().misses == 1, "Unchanged file should be read once"
+
+    todo_path.write_text("- [ ] second entry\n")
+    stat = todo_path.stat()
+    os.utime(todo_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert hook_runtime._collect_todo_lines(tmp_path) == ["- [ ] second entry"]
+    assert cache.cache_info().misses == 2, "Rewritten file should be read again"
+
+
+def test_collect_todo_lines_when_replaced_with_same_mtime_and_size_then_reread(
+    tmp_path: Path,
+) -> None:
+    """Atomically swapped files are detected through the inode in the cache key."""
+    todo_path = tmp_path / "TODO.md"
+    todo_path.write_text("- [ ] alpha\n")
+    stat = todo_path.stat()
+    assert hook_runtime._collect_todo_lines(tmp_path) == ["- [ ] alpha"]
+
+    replacement = tmp_path / "TODO.md.new"
+    replacement.write_text("- [ ] bravo\n")
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    keep_inode_alive = tmp_path / "TODO.md.old"
+    os.link(todo_path, keep_inode_alive)
+    os.replace(replacement, todo_path)
+
+    assert hook_runtime._collect_todo_lines(tmp_path) == ["- [ ] bravo"], (
+        "A different inode must invalidate the cached lines"
+    )
+
+
+def test_collect_todo_lines_when_fifth_match_found_then_rest_not_decoded(tmp_path: Path) -> None:
+    """Scanning stops at the fifth match, so trailing undecodable bytes are never decoded."""
+    items = "".join(f"- [ ] task {index}\n" for index in range(5))
+    (tmp_path / "TODO.md").write_bytes(items.encode() + b"\n" * 20000 + b"\xff\xfe broken\n")
+
+    assert len(hook_runtime._collect_todo_lines(tmp_path)) == 5, "Scan should stop early"
+
+
+def test_collect_todo_lines_when_item_spans_read_blocks_then_found_whole(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Items crossing a block boundary are matched once, from their full line."""
+    monkeypatch.setattr(hook_runtime, "_TODO_READ_SIZE", 16)
+    filler = "x" * 10 + "\n"
+    (tmp_path / "TODO.md").write_text(filler + "- [ ] split across blocks\n- [ ] tail")
+
+    assert hook_runtime._collect_todo_lines(tmp_path) == [
+        "- [ ] split across blocks",
+        "- [ ] tail",
+    ], "Partial lines must be carried into the next block, and the last line kept"
+
+
+def test_collect_plan_hint_when_blank_lines_then_first_five_non_empty(tmp_path: Path) -> None:
+    """Plan hints skip blank lines and keep at most five entries."""
+    (tmp_path / "PLAN.md").write_text("\n# Plan\n\n" + "\n".join(f" step {i}" for i in range(6)))
+
+    assert hook_runtime._collect_plan_hint(tmp_path) == "\n".join(
+        ["# Plan", "step 0", "step 1", "step 2", "step 3"]
+    ), "Plan hint should join the first five non-empty stripped lines"
+    assert hook_runtime._collect_plan_hint(tmp_path / "missing") == ""
+
+
+def test_spawn_helper_when_terminal_configured_then_uses_cached_platform_key(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Terminal lookup uses the import-time platform key and fills ``{command}``."""
+    launched: list[list[str]] = []
+    monkeypatch.setattr(hook_runtime, "_PLATFORM_KEY", "plan9")
+    monkeypatch.setattr(subprocess, "Popen", lambda args, **kwargs: launched.append(args))
+    settings = hook_runtime.UserSettings.default()
+    settings.terminals.defaults["plan9"] = ["term", "-e", "{command}"]
+
+    hook_runtime.spawn_helper(
+        tmp_path / "helper.py",
+        tmp_path,
+        settings,
+        "codex",
+        terminal_env_key="VOMGR_TERMINAL",
+    )
+
+    assert launched == [
+        ["term", "-e", hook_runtime._helper_command_string(tmp_path / "helper.py", tmp_path)]
+    ], "Configured terminal should receive the helper command string"
+
+
+@pytest.mark.parametrize(
+    ("env_payload", "expected_extra"),
+    [({}, None), ({"VOMGR_KILL_OLD": "0"}, {"VOMGR_KILL_OLD": "0"})],
+)
+def test_launch_from_config_when_env_updates_vary_then_environment_built_only_if_needed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    env_payload: dict[str, str],
+    expected_extra: dict[str, str] | None,
+) -> None:
+    """Children inherit the environment directly unless updates must be layered on."""
+    calls: list[dict[str, object]] = []
+
+    class FakeProcess:
+        pid = 4242
+
+        def wait(self) -> int:
+            return 0
+
+    def fake_popen(command: list[str], **kwargs: object) -> FakeProcess:
+        calls.append(kwargs)
+        return FakeProcess()
+
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(hook_runtime, "SessionStateManager", None)
+
+    hook_runtime.launch_from_config({"command": ["true"], "cwd": "", "env": env_payload})
+
+    environment = calls[0]["env"]
+    if expected_extra is None:
+        assert environment is None, "Without updates the parent environment should be inherited"
+    else:
+        assert environment == {**os.environ, **expected_extra}, "Updates should overlay os.environ"
+
+
+def test_write_config_when_written_then_compact_payload_round_trips(tmp_path: Path) -> None:
+    """Configs are written as compact single-line JSON that loads back unchanged."""
+    import json
+
+    config_path = tmp_path / "vocl-new.json"
+    hook_runtime.write_config(config_path, ["codex", "--cd=/p"], tmp_path, {"VOMGR_KILL_OLD": "1"})
+
+    text = config_path.read_text(encoding="utf-8")
+    assert "\n" not in text and ", " not in text, "Output should be compact"
+    assert json.loads(text) == {
+        "command": ["codex", "--cd=/p"],
+        "cwd": str(tmp_path),
+        "env": {"VOMGR_KILL_OLD": "1"},
+    }, "Serialised payload should round-trip"
+
+
+def test_resolve_executable_when_path_unchanged_then_lookup_cached(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repeated resolutions reuse the PATH scan until PATH itself changes."""
+    calls: list[tuple[str, str | None]] = []
+
+    def fake_which(name: str, path: str | None = None) -> str | None:
+        calls.append((name, path))
+        return f"{path}/{name}" if name == "codex" else None
+
+    monkeypatch.setattr(shutil, "which", fake_which)
+    monkeypatch.setenv("PATH", "/first")
+
+    assert hook_runtime.resolve_executable("codex") == "/first/codex"
+    assert hook_runtime.resolve_executable("codex") == "/first/codex"
+    assert hook_runtime.resolve_executable("gemini") == "gemini", "Misses fall back to the name"
+    monkeypatch.setenv("PATH", "/second")
+    assert hook_runtime.resolve_executable("codex") == "/second/codex"
+
+    assert calls == [("codex", "/first"), ("gemini", "/first"), ("codex", "/second")], (
+        "Each (name, PATH) pair should be scanned once"
+    )
+
+
+@pytest.mark.skipif(os.name != "posix", reason="macOS launch path relies on POSIX modes")
+@pytest.mark.parametrize(("override", "app"), [(None, "Terminal"), ("iTerm", "iTerm")])
+def test_run_on_macos_when_terminal_app_then_opens_command_script(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, override: str | None, app: str
+) -> None:
+    """Terminal.app and iTerm receive a private .command script instead of osascript."""
+    import tempfile
+
+    launched: list[list[str]] = []
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    if override is None:
+        monkeypatch.delenv("VOMGR_TERMINAL", raising=False)
+    else:
+        monkeypatch.setenv("VOMGR_TERMINAL", override)
+    monkeypatch.setattr(subprocess, "Popen", lambda args: launched.append(args))
+    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: pytest.fail("osascript used"))
+
+    hook_runtime._run_on_macos(tmp_path / "helper.py", tmp_path, "cd /p && run", "VOMGR_TERMINAL")
+
+    assert launched[0][:3] == ["open", "-a", app], "The terminal should be opened directly"
+    script = Path(launched[0][3])
+    assert script.suffix == ".command" and script.parent == tmp_path
+    assert script.read_text() == (
+        '#!/bin/sh\nrm -f -- "$0"\nexec "${SHELL:-/bin/zsh}" -lc \'cd /p && run\'\n'
+    ), "The command should run in the user's login shell"
+    assert script.stat().st_mode & 0o777 == 0o700, "Script must be private and executable"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="macOS launch path relies on POSIX modes")
+def test_run_on_macos_when_open_fails_then_command_script_removed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed ``open`` launch must not leave the throwaway script behind."""
+    import tempfile
+
+    def failing_popen(args: list[str]) -> None:
+        raise FileNotFoundError("open")
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setenv("VOMGR_TERMINAL", "Terminal")
+    monkeypatch.setattr(subprocess, "Popen", failing_popen)
+
+    with pytest.raises(FileNotFoundError):
+        hook_runtime._run_on_macos(tmp_path / "helper.py", tmp_path, "run", "VOMGR_TERMINAL")
+
+    assert not list(tmp_path.glob("*.command")), "The temp script should be cleaned up"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Runs the script through /bin/sh")
+def test_write_command_script_when_run_then_login_shell_gets_command(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The script removes itself and hands the command to ``$SHELL -lc``."""
+    import tempfile
+
+    fake_shell = tmp_path / "fake-shell"
+    fake_shell.write_text('#!/bin/sh\nprintf "%s|" "$@" > "$(dirname "$0")/args"\n')
+    fake_shell.chmod(0o755)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    script = hook_runtime._write_command_script("echo 'it''s' \"$HOME\"")
+    subprocess.run([str(script)], check=True, env={**os.environ, "SHELL": str(fake_shell)})
+
+    assert not script.exists(), "The script should delete itself"
+    assert (tmp_path / "args").read_text() == "-lc|echo 'it''s' \"$HOME\"|"
+
+
+def test_run_on_macos_when_other_terminal_then_uses_osascript(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Terminals without .command support keep the AppleScript path."""
+    calls: list[list[str]] = []
+    monkeypatch.setenv("VOMGR_TERMINAL", "Hyper")
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: calls.append(args))
+
+    hook_runtime._run_on_macos(tmp_path / "helper.py", tmp_path, "run", "VOMGR_TERMINAL")
+
+    assert calls == [["osascript", "-e", 'tell application "Hyper" to do script "run"']]
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_prepare_env_updates_when_notifications_toggled_then_message_only_if_enabled(
+    tmp_path: Path, enabled: bool
+) -> None:
+    """The notification message is rendered only when notifications are on."""
+    settings = hook_runtime.UserSettings.default()
+    settings.notifications.enabled = enabled
+
+    env = hook_runtime.prepare_env_updates(settings, "claude", "codex", "go", tmp_path)
+
+    assert env["VOMGR_NOTIFICATION_ENABLED"] == ("1" if enabled else "0")
+    assert env["VOMGR_PROJECT_DIR"] == str(tmp_path)
+    assert env.get("VOMGR_NOTIFICATION_MESSAGE") == ("Continuing on codex" if enabled else None), (
+        "Disabled notifications should not carry a message"
+    )
+    assert all(isinstance(value, str) for value in env.values()), "Env values must be strings"
+
+
+def test_import_when_hook_runtime_loaded_then_launch_modules_deferred(
+    assert_not_imported_after: Callable[[str, set[str]], None],
+) -> None:
+    """Importing the runtime must not pull in modules only needed for launching."""
+    assert_not_imported_after(
+        "import vexy_overnight.hook_runtime",
+        {"loguru", "platform", "shlex", "shutil", "subprocess", "tempfile"},
+    )
+
+
+def test_load_launch_config_when_written_then_typed_view_returned(tmp_path: Path) -> None:
+    """Configs written by write_config load back as a validated LaunchConfig."""
+    config_path = tmp_path / "vocl-new.json"
+    hook_runtime.write_config(config_path, ["codex", "", "go"], tmp_path, {"VOMGR_KILL_OLD": "0"})
+
+    config = hook_runtime.load_launch_config(config_path)
+
+    assert config == hook_runtime.LaunchConfig(
+        command=("codex", "go"), cwd=str(tmp_path), env={"VOMGR_KILL_OLD": "0"}
+    ), "Empty command parts should be dropped and values kept as strings"
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        (None, "Missing config file"),
+        ("{broken", "Unable to parse"),
+        ("[1]", "JSON object"),
+        ('{"command": "codex --cd=/p"}', "command must be a list"),
+    ],
+)
+def test_load_launch_config_when_file_unusable_then_none_and_reported(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], content: str | None, message: str
+) -> None:
+    """Missing or malformed configs are reported on stderr instead of raising."""
+    config_path = tmp_path / "voco-new.json"
+    if content is not None:
+        config_path.write_text(content)
+
+    assert hook_runtime.load_launch_config(config_path) is None
+    assert message in capsys.readouterr().err, "The failure reason should reach stderr"
+
+
+def test_launch_from_config_when_command_is_string_then_reported_not_launched(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A string command is rejected instead of being split into characters."""
+    launched: list[object] = []
+    monkeypatch.setattr(subprocess, "Popen", lambda *args, **kwargs: launched.append(args))
+
+    hook_runtime.launch_from_config({"command": "codex", "cwd": "", "env": {}})
+
+    assert launched == [], "Nothing should be spawned for a malformed command"
+    assert "command must be a list" in capsys.readouterr().err
+
+
+def test_escape_applescript_when_quotes_and_backslashes_then_both_escaped() -> None:
+    """Embedded quotes must not terminate the AppleScript string literal."""
+    assert hook_runtime._escape_applescript('cd "/a b" && echo \\n') == (
+        'cd \\"/a b\\" && echo \\\\n'
+    ), "Quotes and backslashes should each be escaped once"
+
+
+@pytest.mark.parametrize(
+    ("template", "expected"),
+    [
+        ("Tasks:\n{todo}\nPlan: {plan}", "Tasks:\n- [ ] open\nPlan: # Plan"),
+        ("Hand over from {source} to {target}", "Hand over from claude to codex"),
+    ],
+)
+def test_build_prompt_when_template_fields_vary_then_only_needed_files_read(
+    tmp_path: Path, template: str, expected: str
+) -> None:
+    """TODO.md and PLAN.md are consulted only when the template references them."""
+    (tmp_path / "TODO.md").write_text("- [ ] open\n")
+    (tmp_path / "PLAN.md").write_text("# Plan\n")
+    settings = hook_runtime.UserSettings.default()
+    settings.prompts["claude"] = template
+
+    assert hook_runtime.build_prompt(settings, "claude", "codex", tmp_path) == expected
+    reads = (
+        hook_runtime._todo_lines_cached.cache_info().misses
+        + hook_runtime._plan_hint_cached.cache_info().misses
+    )
+    assert reads == (2 if "{todo}" in template else 0), "Unused hint files should not be read"
+
+
+def test_resolve_target_when_target_unknown_then_falls_back_to_claude() -> None:
+    """Targets outside the continuation tool set resolve to Claude."""
+    settings = hook_runtime.UserSettings.default()
+    settings.continuations["codex"].target = "emacs"
+
+    assert hook_runtime.resolve_target(settings, "claude") == "codex"
+    assert hook_runtime.resolve_target(settings, "codex") == "claude"
+
+
+@pytest.mark.parametrize(
+    ("template", "expected"),
+    [("Keep going {{as planned}}", "Keep going {as planned}"), ("Broken {", "Broken {")],
+)
+def test_build_prompt_when_template_has_no_fields_then_literal_text_returned(
+    tmp_path: Path, template: str, expected: str
+) -> None:
+    """Field-free templates render their unescaped literal text without formatting."""
+    settings = hook_runtime.UserSettings.default()
+    settings.prompts["claude"] = template
+
+    assert hook_runtime.build_prompt(settings, "claude", "codex", tmp_path) == expected
+    assert hook_runtime.build_prompt(settings, "claude", "codex", tmp_path) == expected
+    assert hook_runtime._compile_template.cache_info().hits == 1, "Parse should be reused"
+
+
+def test_collect_todo_lines_when_crlf_and_lookalikes_then_only_unchecked_items(
+    tmp_path: Path,
+) -> None:
+    """Windows line endings are stripped and near-miss markers are ignored."""
+    (tmp_path / "TODO.md").write_bytes(
+        b"- [x] done\r\n\t- [ ] tabbed\r\n-[ ] no space\r\n  - [ ]\r\ntext - [ ] inline\r\n"
+    )
+
+    assert hook_runtime._collect_todo_lines(tmp_path) == ["- [ ] tabbed", "- [ ]"], (
+        "Only lines that start with an unchecked marker should be collected"
+    )
+
+
+@pytest.mark.parametrize(
+    ("env_updates", "expected"),
+    [
+        (
+            {"VOMGR_NOTIFICATION_ENABLED": "1", "VOMGR_NOTIFICATION_MESSAGE": "Hi"},
+            "[vomgr] Hi\n\a",
+        ),
+        ({"VOMGR_NOTIFICATION_ENABLED": "0", "VOMGR_NOTIFICATION_MESSAGE": "Hi"}, ""),
+        ({"VOMGR_NOTIFICATION_ENABLED": "1"}, ""),
+    ],
+)
+def test_emit_notification_when_enabled_then_line_and_bell_written_together(
+    monkeypatch: pytest.MonkeyPatch, env_updates: dict[str, str], expected: str
+) -> None:
+    """Enabled notifications issue one write (message plus bell) and one flush."""
+    writes: list[str] = []
+    flushes: list[None] = []
+    monkeypatch.setattr(sys.stdout, "write", writes.append)
+    monkeypatch.setattr(sys.stdout, "flush", lambda: flushes.append(None))
+
+    hook_runtime._emit_notification(env_updates)
+
+    assert "".join(writes) == expected
+    assert len(writes) == len(flushes) == (1 if expected else 0), "Expected one write and flush"
@@ -8,6 +8,7 @@ import json
 import os
 import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -288,3 +289,96 @@ def test_vocl_new_helper_when_run_then_session_state_rotated(
     assert session_payload["tool"] == "codex", "Target tool should be recorded"
     assert session_payload["cwd"] == str(project_dir)
     assert session_payload["pid"] == recorded["pid"], "PID must match launched process"
+
+
+def test_install_hooks_when_run_twice_then_templates_read_once(
+    fake_home: Path, hook_manager: HookManager
+) -> None:
+    """Packaged templates are loaded once and reused by later installs."""
+    from vexy_overnight.hooks import _load_template
+
+    _load_template.cache_clear()
+    hook_manager.install_hooks()
+    HookManager().install_hooks()
+
+    info = _load_template.cache_info()
+    assert info.misses == 5, "Each of the five templates should be read once"
+    assert info.hits == 5, "The second install should render from the cache"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_install_hooks_when_reinstalled_then_scripts_replaced_atomically(
+    fake_home: Path, hook_manager: HookManager
+) -> None:
+    """Reinstalling swaps in a new executable file and leaves no temp files."""
+    hook_manager.install_hooks()
+    claude_hook = fake_home / ".claude" / "hooks" / "vocl-go.py"
+    claude_hook.write_text("stale")
+    original_inode = claude_hook.stat().st_ino
+
+    old_umask = os.umask(0o077)
+    try:
+        hook_manager.install_hooks()
+    finally:
+        os.umask(old_umask)
+
+    assert claude_hook.read_text() != "stale", "Install must rewrite the script"
+    assert claude_hook.stat().st_ino != original_inode, "Script should be renamed into place"
+    assert claude_hook.stat().st_mode & 0o777 == 0o755, "Mode must not depend on the umask"
+    assert not list(fake_home.rglob("*.tmp")), "No temporary files should remain"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_install_hooks_when_content_unchanged_then_files_left_untouched(
+    fake_home: Path, hook_manager: HookManager
+) -> None:
+    """Identical scripts are not rewritten, but a lost executable bit is restored."""
+    hook_manager.install_hooks()
+    claude_hook = fake_home / ".claude" / "hooks" / "vocl-go.py"
+    codex_hook = fake_home / ".codex" / "voco-go.py"
+    before = claude_hook.stat()
+    codex_hook.chmod(0o644)
+
+    hook_manager.install_hooks()
+
+    after = claude_hook.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns), (
+        "Unchanged scripts should not be rewritten"
+    )
+    assert codex_hook.stat().st_mode & 0o777 == 0o755, "Wrong modes should trigger a rewrite"
+
+
+def test_import_when_hooks_loaded_then_loguru_deferred(
+    assert_not_imported_after: Callable[[str, set[str]], None],
+) -> None:
+    """Importing the hook manager must not load ``loguru`` until something is logged."""
+    assert_not_imported_after("import vexy_overnight.hooks", {"loguru"})
+
+
+def test_write_template_when_context_value_missing_then_value_error(
+    fake_home: Path, hook_manager: HookManager
+) -> None:
+    """Rendering from cached segments still reports missing placeholders."""
+    destination = fake_home / "voco-new.py"
+
+    with pytest.raises(ValueError, match="config_filename"):
+        hook_manager._write_template("voco_new.py", destination, {})
+    assert not destination.exists(), "Nothing should be written for an incomplete context"
+
+
+def test_install_hooks_when_directories_exist_then_mkdir_skipped(
+    fake_home: Path, hook_manager: HookManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Reinstalling only stats the hook directories instead of recreating them."""
+    hook_manager.install_hooks()
+    created: list[Path] = []
+    original_mkdir = Path.mkdir
+
+    def recording_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+        created.append(self)
+        original_mkdir(self, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+    hook_manager.install_hooks()
+
+    assert created == [], "Existing hook directories must not be re-created"
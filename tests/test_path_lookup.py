@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# this_file: tests/test_path_lookup.py
+"""Tests for the memoised executable lookup."""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from vexy_overnight.path_lookup import which
+
+
+def test_which_when_path_changes_then_rescanned(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lookups are cached per ``(name, PATH)`` pair and rescanned for a new PATH."""
+    calls: list[tuple[str, str | None]] = []
+
+    def fake_which(name: str, path: str | None = None) -> str | None:
+        calls.append((name, path))
+        return f"{path}/{name}"
+
+    monkeypatch.setattr(shutil, "which", fake_which)
+    which.cache_clear()
+
+    assert which("codex", "/a") == "/a/codex"
+    assert which("codex", "/a") == "/a/codex"
+    assert which("codex", "/b") == "/b/codex"
+    assert calls == [("codex", "/a"), ("codex", "/b")], "Only new PATH values should rescan"
+    which.cache_clear()
@@ -89,7 +89,17 @@ def test_load_user_settings_when_file_missing_then_defaults_written(fake_home: P
     assert settings_path.exists(), "Loading defaults should persist settings file"
 
 
-@pytest.mark.parametrize("tool", sorted(CONTINUATION_TOOLS))
+def test_user_settings_from_dict_when_tools_missing_then_defaults_in_stable_order() -> None:
+    """Missing continuation entries are filled in deterministic tool order."""
+    settings = UserSettings.from_dict({})
+
+    assert list(settings.continuations) == ["claude", "codex", "gemini"], (
+        "Continuation defaults should serialise in a stable order"
+    )
+    assert CONTINUATION_TOOLS == ("claude", "codex", "gemini"), "Public tools stay an ordered tuple"
+
+
+@pytest.mark.parametrize("tool", CONTINUATION_TOOLS)
 def test_user_settings_prompts_when_missing_then_inherit_default(tool: str) -> None:
     """Prompt lookup should fall back to default template when specific tool missing."""
     settings = UserSettings.default()
@@ -98,3 +108,66 @@ def test_user_settings_prompts_when_missing_then_inherit_default(tool: str) -> N
     prompt = settings.prompt_for(tool)
 
     assert "Continue" in prompt, "Fallback prompt should be informative"
+
+
+def test_load_user_settings_when_file_unchanged_then_parse_reused(
+    fake_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated loads of an unchanged file should not re-parse TOML."""
+    save_user_settings(UserSettings.default())
+    first = load_user_settings()
+
+    def fail_parse(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("settings should be served from cache")
+
+    monkeypatch.setattr(tomli, "loads", fail_parse)
+    second = load_user_settings()
+
+    assert second == first
+    second.notifications.message = "mutated"
+    assert load_user_settings().notifications.message != "mutated", (
+        "Cached payload must not be shared with returned settings"
+    )
+
+
+def test_load_user_settings_when_saved_then_reflects_new_content(fake_home: Path) -> None:
+    """Saving settings must invalidate the cached payload."""
+    save_user_settings(UserSettings.default())
+    load_user_settings()
+
+    updated = UserSettings.default()
+    updated.notifications.message = "after save"
+    save_user_settings(updated)
+
+    assert load_user_settings().notifications.message == "after save"
+
+
+def test_load_user_settings_when_just_saved_then_served_without_parsing(
+    fake_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A save seeds the cache so the following load does not re-parse."""
+    updated = UserSettings.default()
+    updated.notifications.message = "seeded"
+    save_user_settings(updated)
+
+    def fail_parse(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("freshly saved settings should be cached")
+
+    monkeypatch.setattr(tomli, "loads", fail_parse)
+
+    assert load_user_settings().notifications.message == "seeded"
+
+
+def test_load_user_settings_when_edited_with_same_mtime_then_reparsed(fake_home: Path) -> None:
+    """External edits that keep the mtime are still detected via size/inode."""
+    import os
+
+    save_user_settings(UserSettings.default())
+    path = fake_home / ".vexy-overnight" / SETTINGS_FILE_NAME
+    load_user_settings()
+    original = path.stat()
+
+    path.write_text(path.read_text().replace("Continuing on", "Handing over to"))
+    os.utime(path, ns=(original.st_atime_ns, original.st_mtime_ns))
+
+    assert load_user_settings().notifications.message.startswith("Handing over to")
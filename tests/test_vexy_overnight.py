@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 import pytest
@@ -19,6 +20,49 @@ def test_import_exposes_public_api() -> None:
     assert callable(pkg.process_data), "Package should expose process_data callable"
 
 
+def test_import_when_manager_accessed_then_resolved_lazily_and_cached() -> None:
+    """Manager exports resolve on first access and are cached on the package."""
+    import vexy_overnight as pkg
+    from vexy_overnight.config import ConfigManager
+
+    assert "ConfigManager" in dir(pkg), "Lazy exports should be listed by dir()"
+    assert pkg.ConfigManager is ConfigManager, "Lazy export must resolve to the real class"
+    assert vars(pkg)["ConfigManager"] is ConfigManager, "Resolved export should be cached"
+
+    with pytest.raises(AttributeError, match="has no attribute 'DoesNotExist'"):
+        _ = pkg.DoesNotExist  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("name", ["HookManager", "LauncherManager", "RulesManager", "vocl"])
+def test_import_when_lazy_export_requested_then_never_none(name: str) -> None:
+    """Lazy exports resolve to real objects instead of ``None`` placeholders."""
+    import vexy_overnight as pkg
+
+    assert getattr(pkg, name) is not None, f"{name} must resolve to a real object"
+
+
+def test_import_when_package_loaded_then_manager_modules_not_imported(
+    assert_not_imported_after: Callable[[str, set[str]], None],
+) -> None:
+    """A bare package import loads only the version and legacy helper modules."""
+    submodules = (
+        "cli",
+        "config",
+        "file_signature",
+        "hook_entry",
+        "hook_runtime",
+        "hooks",
+        "launchers",
+        "rules",
+        "session_state",
+        "updater",
+        "user_settings",
+    )
+    assert_not_imported_after(
+        "import vexy_overnight", {f"vexy_overnight.{name}" for name in submodules}
+    )
+
+
 def test_process_data_when_valid_input_then_returns_summary() -> None:
     """Valid input sequences yield a populated summary mapping."""
     import vexy_overnight as pkg